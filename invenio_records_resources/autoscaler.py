@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Autoscaling of the bulk indexers.
+
+The ``manage_indexer_queues`` task periodically samples the depth of the bulk
+indexing queues. From the backlog drained between two samples, the autoscaler
+estimates the throughput of a consumer, and derives how many consumers to start
+to drain the backlog within a target time and how large their bulk requests
+should be.
+
+Samples are kept in the memory of the process running the task. Until two
+samples of a queue are available, the configured throughput is assumed.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+ScalingDecision = namedtuple(
+    "ScalingDecision", ["backlog", "consumers", "start", "chunk_size", "rate", "eta"]
+)
+"""Decision of the autoscaler for a queue.
+
+``consumers`` is the number of consumers once ``start`` new ones are started,
+``rate`` the estimated throughput of a consumer (messages per second), and
+``eta`` the estimated time to drain the backlog in seconds.
+"""
+
+
+class BulkIndexerAutoscaler:
+    """Decide how many bulk indexers to start from the depth of their queues."""
+
+    def __init__(
+        self,
+        consumer_rate=500.0,
+        target_drain_time=60,
+        chunk_size=(100, 2000),
+        smoothing=0.5,
+        timer=time.monotonic,
+    ):
+        """Constructor.
+
+        :param consumer_rate: Assumed throughput of a consumer (messages per
+            second) until it is measured.
+        :param target_drain_time: Time in seconds in which the backlog should be
+            drained.
+        :param chunk_size: Minimum and maximum size of the bulk requests.
+        :param smoothing: Weight of the last measure in the throughput estimate.
+        :param timer: Function returning the current time in seconds.
+        """
+        self.consumer_rate = consumer_rate
+        self.target_drain_time = target_drain_time
+        self.chunk_size = chunk_size
+        self.smoothing = smoothing
+        self._timer = timer
+        self._samples = {}
+        self._rates = {}
+
+    def rate(self, name):
+        """Estimated throughput of a consumer of a queue."""
+        return self._rates.get(name, self.consumer_rate)
+
+    def _measure(self, name, now, backlog):
+        """Update the throughput estimate from the previous sample."""
+        sample = self._samples.get(name)
+        if sample is None:
+            return
+        then, prev_backlog, prev_consumers = sample
+        elapsed = now - then
+        drained = prev_backlog - backlog
+        # Messages published in the meantime are not known, so the backlog
+        # drained is a lower bound, only used when it actually decreased.
+        if elapsed <= 0 or prev_consumers <= 0 or drained <= 0:
+            return
+        measured = drained / elapsed / prev_consumers
+        previous = self.rate(name)
+        self._rates[name] = previous + self.smoothing * (measured - previous)
+
+    def scale(self, name, backlog, consumers, max_consumers):
+        """Decide how many consumers to start for a queue.
+
+        :param name: Name of the indexer.
+        :param backlog: Number of messages in the queue.
+        :param consumers: Number of consumers of the queue.
+        :param max_consumers: Maximum number of consumers of the queue.
+        """
+        now = self._timer()
+        self._measure(name, now, backlog)
+        rate = self.rate(name)
+
+        start = 0
+        if backlog > 0:
+            needed = math.ceil(backlog / (rate * self.target_drain_time))
+            start = max(min(needed, max_consumers) - consumers, 0)
+        total = consumers + start
+
+        min_chunk, max_chunk = self.chunk_size
+        chunk_size = min(max(math.ceil(backlog / max(total, 1)), min_chunk), max_chunk)
+        eta = backlog / (rate * total) if total else (0.0 if not backlog else None)
+
+        self._samples[name] = (now, backlog, total)
+        return ScalingDecision(backlog, total, start, chunk_size, rate, eta)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Bounded in-process cache with LRU eviction and optional TTL."""
+
+import time
+from collections import OrderedDict
+from threading import RLock
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache.
+
+    Entries are evicted when more than ``maxsize`` entries are stored, and
+    expire ``ttl`` seconds after being set (if a ``ttl`` is given).
+
+    .. code-block:: python
+
+        cache = LRUCache(maxsize=100, ttl=60)
+        cache.set("key", "value")
+        cache.get("key")  # "value"
+    """
+
+    _missing = object()
+
+    def __init__(self, maxsize=1024, ttl=None, timer=time.monotonic):
+        """Constructor.
+
+        :param maxsize: Maximum number of entries to keep.
+        :param ttl: Time to live of an entry in seconds (``None`` for no expiry).
+        :param timer: Function returning the current time in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """Get a value from the cache."""
+        with self._lock:
+            entry = self._data.get(key, self._missing)
+            if entry is not self._missing:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        """Set a value in the cache.
+
+        :param ttl: Overrides the default time to live of the cache.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a value from the cache (if present)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all values and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """Ratio of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key):
+        """Check if a non-expired value is cached (does not count as lookup)."""
+        with self._lock:
+            entry = self._data.get(key, self._missing)
+            if entry is self._missing:
+                return False
+            expires_at = entry[1]
+            return expires_at is None or expires_at > self._timer()
+
+    def __len__(self):
+        """Number of stored entries (including expired but not yet evicted)."""
+        return len(self._data)
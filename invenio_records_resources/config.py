@@ -24,3 +24,130 @@ RECORDS_RESOURCES_IMAGE_FORMATS = [".jpg", ".jpeg", ".jp2", ".png", ".tif", ".ti
 
 RECORDS_RESOURCES_ALLOW_EMPTY_FILES = True
 """Allow empty files to be uploaded."""
+
+RECORDS_RESOURCES_SEARCH_CACHE = (
+    "invenio_records_resources.services.search_cache:SharedSearchCache"
+)
+"""Search responses cache backend.
+
+It is only used by services which set ``search_cache_ttl`` in their config.
+The default backend stores the responses in the Invenio-Cache cache, shared by
+all processes. ``InMemorySearchCache`` keeps them per process (e.g. for tests).
+"""
+
+RECORDS_RESOURCES_READ_CACHE_SIZE = 1024
+"""Maximum number of records kept by the read cache (per process).
+
+The read cache is only used by PID fields defined with ``read_cache=True``.
+"""
+
+RECORDS_RESOURCES_READ_CACHE_TTL = 60
+"""Time to live in seconds of a record in the read cache."""
+
+RECORDS_RESOURCES_READ_CACHE_STRICT = True
+"""Validate read cache hits against the record's version in the database.
+
+If disabled, changes made by other processes might only be visible once the
+cached record expires.
+"""
+
+RECORDS_RESOURCES_RELATION_CACHE_SIZE = 1024
+"""Maximum number of related records kept by the relation cache (per process).
+
+The relation cache is only used by PID relations defined with
+``shared_cache=True``.
+"""
+
+RECORDS_RESOURCES_RELATION_CACHE_TTL = 300
+"""Time to live in seconds of a record in the relation cache.
+
+Records are invalidated by change notifications in the process sending or
+handling them, other processes only see the changes once the record expires.
+"""
+
+RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_ENABLED = True
+"""Cache the search filters of the permission policies (per process).
+
+Only the filters of policies whose generators only depend on the identity's
+needs are cached (see ``cached_permission_filter()``).
+"""
+
+RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_SIZE = 1024
+"""Maximum number of search filters kept by the permission filter cache."""
+
+RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_TTL = 300
+"""Time to live in seconds of a search filter in the permission filter cache.
+
+It bounds how long a change of the (database stored) superuser grants takes
+to be reflected in the filters.
+"""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_DEBOUNCE = False
+"""Debounce change notifications across units of work.
+
+If enabled, the records changed by a unit of work are published to an outbox
+queue instead of being sent right after the commit. The outbox is drained by
+the ``flush_change_notifications`` task, which must then be scheduled, e.g.:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        "flush-change-notifications": {
+            "task": "invenio_records_resources.tasks.flush_change_notifications",
+            "schedule": timedelta(seconds=10),
+        },
+    }
+
+The schedule interval is the debounce window.
+"""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_QUEUE = "records-resources-notifications"
+"""Name of the outbox queue of the debounced change notifications."""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_FLUSH_SIZE = 10000
+"""Maximum number of outbox messages consumed by a flush."""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_CHUNK_SIZE = 1000
+"""Maximum number of changed records passed to a handler at once.
+
+Larger notifications are split into chunks, each handled by its own task.
+"""
+
+RECORDS_RESOURCES_RELATIONS_MAX_TERMS_COUNT = 65536
+"""Maximum number of terms in the queries matching outdated relations.
+
+It should match the ``index.max_terms_count`` setting of the search indices.
+The changed records of a notification are matched with a single query unless
+they exceed it.
+"""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_MAX_RETRIES = 3
+"""Number of times a failed change notification handler is retried."""
+
+RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_EAGER_WORKERS = 1
+"""Number of threads running the handlers when tasks are executed eagerly.
+
+Handlers run in a new application context (and database session) in each
+thread, so only raise it if the handlers do not depend on uncommitted data
+(e.g. in tests using a transaction per test).
+"""
+
+RECORDS_RESOURCES_INDEXER_CONSUMER_RATE = 500
+"""Assumed throughput of a bulk indexer (messages per second).
+
+It is used by ``manage_indexer_queues`` until the throughput is measured from
+the backlog drained between two runs of the task.
+"""
+
+RECORDS_RESOURCES_INDEXER_TARGET_DRAIN_TIME = 60
+"""Time in seconds in which bulk indexers should drain their queue.
+
+``manage_indexer_queues`` starts as many bulk indexers as needed to meet it,
+up to ``INDEXER_MAX_BULK_CONSUMERS``.
+"""
+
+RECORDS_RESOURCES_INDEXER_BULK_CHUNK_SIZE = (100, 2000)
+"""Minimum and maximum size of the bulk requests of the bulk indexers.
+
+Within these bounds, the backlog of a queue is split between its indexers.
+"""
@@ -8,7 +8,12 @@
 
 """Invenio Records Resources module to create REST APIs."""
 
+from invenio_base.utils import load_or_import_from_config
+
 from . import config
+from .autoscaler import BulkIndexerAutoscaler
+from .cache import LRUCache
+from .records.cache import RecordReadCache, RelationCache
 from .registry import NotificationRegistry, ServiceRegistry
 
 
@@ -25,6 +30,22 @@ class InvenioRecordsResources(object):
         self.init_config(app)
         self.registry = ServiceRegistry()
         self.notification_registry = NotificationRegistry()
+        self.search_cache = self.init_search_cache(app)
+        self.read_cache = RecordReadCache(
+            maxsize=app.config["RECORDS_RESOURCES_READ_CACHE_SIZE"],
+            ttl=app.config["RECORDS_RESOURCES_READ_CACHE_TTL"],
+            strict=app.config["RECORDS_RESOURCES_READ_CACHE_STRICT"],
+        )
+        self.relation_cache = RelationCache(
+            maxsize=app.config["RECORDS_RESOURCES_RELATION_CACHE_SIZE"],
+            ttl=app.config["RECORDS_RESOURCES_RELATION_CACHE_TTL"],
+        )
+        self.permission_filter_cache = self.init_permission_filter_cache(app)
+        self.indexer_autoscaler = BulkIndexerAutoscaler(
+            consumer_rate=app.config["RECORDS_RESOURCES_INDEXER_CONSUMER_RATE"],
+            target_drain_time=app.config["RECORDS_RESOURCES_INDEXER_TARGET_DRAIN_TIME"],
+            chunk_size=app.config["RECORDS_RESOURCES_INDEXER_BULK_CHUNK_SIZE"],
+        )
         app.extensions["invenio-records-resources"] = self
 
     def init_config(self, app):
@@ -32,3 +53,19 @@ class InvenioRecordsResources(object):
         for k in dir(config):
             if k.startswith("RECORDS_RESOURCES_") or k.startswith("SITE_"):
                 app.config.setdefault(k, getattr(config, k))
+
+    def init_search_cache(self, app):
+        """Initialize the search responses cache backend."""
+        search_cache_cls = load_or_import_from_config(
+            "RECORDS_RESOURCES_SEARCH_CACHE", app=app
+        )
+        return search_cache_cls() if search_cache_cls else None
+
+    def init_permission_filter_cache(self, app):
+        """Initialize the cache of the permission search filters."""
+        if not app.config["RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_ENABLED"]:
+            return None
+        return LRUCache(
+            maxsize=app.config["RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_SIZE"],
+            ttl=app.config["RECORDS_RESOURCES_PERMISSION_FILTER_CACHE_TTL"],
+        )
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Change notifications outbox.
+
+When change notifications are debounced, the changed records are not sent
+right after the commit of the unit of work, but published to a message queue
+(the outbox). The ``flush_change_notifications`` task drains the outbox and
+sends a single notification task per record type, carrying all the records
+changed in the meantime. The debounce window is the interval at which the
+flush task is scheduled.
+"""
+
+from contextlib import contextmanager
+
+from celery import current_app as current_celery_app
+from flask import current_app
+from kombu import Producer, Queue
+
+
+def merge_records_info(records_info):
+    """Merge ``(recid, uuid, revision_id)`` tuples of change notifications.
+
+    Only the latest revision of each record is kept, in the order in which the
+    records were first changed.
+    """
+    merged = {}
+    for recid, uuid, revision_id in records_info:
+        current = merged.get(uuid)
+        if current is None or revision_id >= current[2]:
+            merged[uuid] = (recid, uuid, revision_id)
+    return list(merged.values())
+
+
+def change_notifications_queue():
+    """Message queue used as outbox of the debounced change notifications."""
+    name = current_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_QUEUE"]
+    return Queue(
+        name,
+        exchange=current_app.config["INDEXER_MQ_EXCHANGE"],
+        routing_key=name,
+    )
+
+
+def publish_change_notification(record_type, records_info):
+    """Publish changed records to the outbox."""
+    queue = change_notifications_queue()
+    with current_celery_app.pool.acquire(block=True) as conn:
+        producer = Producer(
+            conn,
+            exchange=queue.exchange,
+            routing_key=queue.routing_key,
+            auto_declare=True,
+        )
+        producer.publish(
+            {"record_type": record_type, "records_info": records_info},
+            declare=[queue],
+        )
+
+
+@contextmanager
+def pending_change_notifications(max_messages=None):
+    """Consume the outbox, merging the changed records per record type.
+
+    Yields a dictionary of record type to merged ``records_info``. The consumed
+    messages are only acknowledged once the block exits without errors,
+    otherwise they are delivered again on the next flush.
+
+    :param max_messages: Maximum number of messages to consume.
+    """
+    if max_messages is None:
+        max_messages = current_app.config[
+            "RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_FLUSH_SIZE"
+        ]
+    queue = change_notifications_queue()
+    with current_celery_app.pool.acquire(block=True) as conn:
+        outbox = conn.SimpleQueue(queue)
+        try:
+            messages = []
+            try:
+                while len(messages) < max_messages:
+                    messages.append(outbox.get_nowait())
+            except outbox.Empty:
+                pass
+
+            notifications = {}
+            for message in messages:
+                notifications.setdefault(message.payload["record_type"], []).extend(
+                    message.payload["records_info"]
+                )
+            yield {
+                record_type: merge_records_info(records_info)
+                for record_type, records_info in notifications.items()
+            }
+
+            for message in messages:
+                message.ack()
+        finally:
+            outbox.close()
@@ -21,3 +21,15 @@ current_notifications_registry = LocalProxy(
     lambda: current_app.extensions["invenio-records-resources"].notification_registry
 )
 """Helper proxy to get the current notifications registry."""
+
+
+current_search_cache = LocalProxy(
+    lambda: current_app.extensions["invenio-records-resources"].search_cache
+)
+"""Helper proxy to get the current search responses cache."""
+
+
+current_indexer_autoscaler = LocalProxy(
+    lambda: current_app.extensions["invenio-records-resources"].indexer_autoscaler
+)
+"""Helper proxy to get the current bulk indexers autoscaler."""
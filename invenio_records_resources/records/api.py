@@ -19,6 +19,7 @@ from invenio_records.api import Record as RecordBase
 from invenio_records.dumpers import SearchDumper
 from invenio_records.systemfields import DictField, SystemField, SystemFieldsMixin
 from invenio_records.systemfields.model import ModelField
+from sqlalchemy.orm import joinedload
 
 
 class Record(RecordBase, SystemFieldsMixin):
@@ -146,20 +147,49 @@ class FileRecord(RecordBase, SystemFieldsMixin):
     """Base class for a record describing a file."""
 
     @classmethod
-    def get_by_key(cls, record_id, key):
+    def _query(cls):
+        """Query of file records, with their object version and file instance.
+
+        They are loaded with the file records (instead of one at a time), as
+        they are needed for the file's size, checksum and mimetype.
+        """
+        return cls.model_cls.query.options(
+            joinedload(cls.model_cls.object_version).joinedload(ObjectVersion.file)
+        )
+
+    @classmethod
+    def get_by_key(cls, record_id, key, with_deleted=False):
         """Get a record file by record ID and filename/key."""
         with db.session.no_autoflush:
-            obj = cls.model_cls.query.filter(
-                cls.record_id == record_id, cls.key == key
-            ).one_or_none()
+            query = cls._query().filter(
+                cls.model_cls.record_id == record_id, cls.model_cls.key == key
+            )
+
+            if not with_deleted:
+                query = query.filter(cls.model_cls.is_deleted != True)
+
+            obj = query.one_or_none()
             if obj:
                 return cls(obj.data, model=obj)
 
+    @classmethod
+    def get_by_keys(cls, record_id, keys, with_deleted=False):
+        """Get the record files of a record ID with the given filenames/keys."""
+        with db.session.no_autoflush:
+            query = cls._query().filter(
+                cls.model_cls.record_id == record_id, cls.model_cls.key.in_(keys)
+            )
+
+            if not with_deleted:
+                query = query.filter(cls.model_cls.is_deleted != True)
+
+            return [cls(obj.data, model=obj) for obj in query]
+
     @classmethod
     def list_by_record(cls, record_id, with_deleted=False):
         """List all record files by record ID."""
         with db.session.no_autoflush:
-            query = cls.model_cls.query.filter(cls.model_cls.record_id == record_id)
+            query = cls._query().filter(cls.model_cls.record_id == record_id)
 
             if not with_deleted:
                 query = query.filter(cls.model_cls.is_deleted != True)
@@ -167,6 +197,44 @@ class FileRecord(RecordBase, SystemFieldsMixin):
             for obj in query:
                 yield cls(obj.data, model=obj)
 
+    #: Columns by which file records can be sorted in pages.
+    sort_options = ("key", "created", "updated")
+
+    @classmethod
+    def list_by_record_page(
+        cls, record_id, page=1, size=100, prefix=None, sort="key", with_deleted=False
+    ):
+        """List a page of record files by record ID.
+
+        :param prefix: Only list the files whose key starts with the prefix.
+        :param sort: Column to sort by (one of ``sort_options``), prefixed with
+            ``-`` for descending order.
+        :returns: A tuple of the total number of files and the files of the page.
+        """
+        name = sort[1:] if sort.startswith("-") else sort
+        if name not in cls.sort_options:
+            raise ValueError(f"Invalid sort option '{sort}'.")
+        column = getattr(cls.model_cls, name)
+        order_by = column.desc() if sort.startswith("-") else column.asc()
+
+        with db.session.no_autoflush:
+            query = cls._query().filter(cls.model_cls.record_id == record_id)
+
+            if not with_deleted:
+                query = query.filter(cls.model_cls.is_deleted != True)
+            if prefix:
+                query = query.filter(
+                    cls.model_cls.key.startswith(prefix, autoescape=True)
+                )
+
+            total = query.count()
+            query = (
+                query.order_by(order_by, cls.model_cls.id)
+                .offset((page - 1) * size)
+                .limit(size)
+            )
+            return total, [cls(obj.data, model=obj) for obj in query]
+
     @property
     def file(self):
         """File wrapper object."""
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Caches of resolved records.
+
+The read cache maps a PID to the record UUID, and the record UUID to the column
+values of the record (including its JSON) and of its PID. On a cache hit, the
+models are merged into the database session without querying the database.
+
+In strict mode (the default), every hit is validated against the
+``version_id`` of the record row, which is a cheap query compared to the
+resolution of the PID and the load of the JSON document.
+
+The relation cache keeps the records resolved by PID relations, detached from
+the database session, for the dereferencing of relations.
+"""
+
+from copy import deepcopy
+
+from flask import current_app
+from invenio_db import db
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..cache import LRUCache
+
+
+def _dump_model(model):
+    """Dump the column values of a model."""
+    values = {
+        attr.key: getattr(model, attr.key)
+        for attr in inspect(model).mapper.column_attrs
+    }
+    return deepcopy(values)
+
+
+def _detached_model(model_cls, values):
+    """Build a detached model from column values."""
+    obj = inspect(model_cls).class_manager.new_instance()
+    for key, value in deepcopy(values).items():
+        setattr(obj, key, value)
+    make_transient_to_detached(obj)
+    return obj
+
+
+def _load_model(model_cls, values):
+    """Merge a model built from column values into the session (no query)."""
+    return db.session.merge(_detached_model(model_cls, values), load=False)
+
+
+def _is_clean(obj):
+    """Check if a model is persistent and without pending changes."""
+    state = inspect(obj, raiseerr=False)
+    return state is not None and state.persistent and not state.modified
+
+
+class RecordReadCache:
+    """Read-through cache of records resolved by PID."""
+
+    def __init__(self, maxsize=1024, ttl=60, strict=True):
+        """Constructor.
+
+        :param maxsize: Maximum number of records to keep.
+        :param ttl: Time to live of a cached record in seconds.
+        :param strict: Validate every hit against the record's ``version_id``.
+        """
+        self.strict = strict
+        self._pids = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._records = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _record_key(record_cls, record_id):
+        return (record_cls.model_cls.__tablename__, str(record_id))
+
+    @staticmethod
+    def _pid_key(record_cls, pid_type, pid_value):
+        return (record_cls.model_cls.__tablename__, pid_type, pid_value)
+
+    def get(self, record_cls, pid_type, pid_value):
+        """Get a cached ``(pid, record)`` tuple (``None`` on a miss)."""
+        record_id = self._pids.get(self._pid_key(record_cls, pid_type, pid_value))
+        if record_id is None:
+            return None
+        record_key = self._record_key(record_cls, record_id)
+        entry = self._records.get(record_key)
+        if entry is None:
+            return None
+
+        model_cls = record_cls.model_cls
+        if self.strict:
+            version_id = (
+                db.session.query(model_cls.version_id)
+                .filter(model_cls.id == entry["model"]["id"])
+                .scalar()
+            )
+            if version_id != entry["model"]["version_id"]:
+                self._records.delete(record_key)
+                return None
+
+        pid = _load_model(entry["pid_cls"], entry["pid"])
+        model = _load_model(model_cls, entry["model"])
+        return pid, record_cls(model.data, model=model)
+
+    def set(self, record_cls, pid, record):
+        """Cache a resolved record.
+
+        Only records in a clean state (i.e. without changes pending in the
+        database session) are cached.
+        """
+        model = record.model
+        if model is None or record.is_deleted:
+            return
+        if not (_is_clean(model) and _is_clean(pid)):
+            return
+
+        self._records.set(
+            self._record_key(record_cls, model.id),
+            {
+                "model": _dump_model(model),
+                "pid": _dump_model(pid),
+                "pid_cls": type(pid),
+            },
+        )
+        self._pids.set(
+            self._pid_key(record_cls, pid.pid_type, pid.pid_value), str(model.id)
+        )
+
+    def invalidate(self, record):
+        """Remove a record from the cache."""
+        if record.id is not None:
+            self._records.delete(self._record_key(type(record), record.id))
+
+    def clear(self):
+        """Remove all records from the cache."""
+        self._pids.clear()
+        self._records.clear()
+
+
+class RelationCache:
+    """Process-wide cache of the records resolved by PID relations.
+
+    Records are kept detached from the database session. Entries expire after
+    the TTL, and are invalidated when the related records are updated (see
+    ``invalidate_relation_cache()``).
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        """Constructor.
+
+        :param maxsize: Maximum number of records to keep.
+        :param ttl: Time to live of a cached record in seconds.
+        """
+        self._pids = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._records = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _pid_key(record_cls, pid_value):
+        return (record_cls.model_cls.__tablename__, pid_value)
+
+    def get(self, record_cls, pid_value):
+        """Get a cached record (``None`` on a miss)."""
+        record_id = self._pids.get(self._pid_key(record_cls, pid_value))
+        entry = self._records.get(record_id) if record_id else None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        model = _detached_model(record_cls.model_cls, entry["model"])
+        return record_cls(model.data, model=model)
+
+    def set(self, record_cls, pid_value, record):
+        """Cache a resolved record, if it has no changes pending."""
+        model = record.model
+        if model is None or record.is_deleted or not _is_clean(model):
+            return
+        self._records.set(str(model.id), {"model": _dump_model(model)})
+        self._pids.set(self._pid_key(record_cls, pid_value), str(model.id))
+
+    def invalidate(self, record_id):
+        """Remove a record from the cache."""
+        self._records.delete(str(record_id))
+
+    def clear(self):
+        """Remove all records from the cache and reset the counters."""
+        self._pids.clear()
+        self._records.clear()
+        self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """Ratio of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        """Number of cached records."""
+        return len(self._records)
+
+
+def current_read_cache():
+    """Get the read cache of the current application (if any)."""
+    ext = current_app.extensions.get("invenio-records-resources")
+    return getattr(ext, "read_cache", None)
+
+
+def invalidate_read_cache(record):
+    """Remove a record from the read cache of the current application."""
+    read_cache = current_read_cache()
+    if read_cache is not None and getattr(type(record), "model_cls", None):
+        read_cache.invalidate(record)
+
+
+def current_relation_cache():
+    """Get the relation cache of the current application (if any)."""
+    ext = current_app.extensions.get("invenio-records-resources")
+    return getattr(ext, "relation_cache", None)
+
+
+def invalidate_relation_cache(records_info):
+    """Invalidate updated records in the relation cache.
+
+    :param records_info: A list of ``(recid, uuid, revision_id)`` tuples, as
+        sent with change notifications.
+    """
+    relation_cache = current_relation_cache()
+    if relation_cache is not None:
+        for _, record_id, _ in records_info:
+            relation_cache.invalidate(record_id)
@@ -45,12 +45,20 @@ class CustomFieldsDumperExt(SearchDumperExt):
 class PartialFileDumper(Dumper):
     """File in record dumper."""
 
+    def __init__(self, previous=None):
+        """Constructor.
+
+        :param previous: The previous dump of the file (e.g. as stored in the
+            record), whose metadata is reused if the metadata is unchanged.
+        """
+        self._previous = previous or {}
+
     def dump(self, record, data):
         """Dump a partial file record to include into another record."""
         data = {
             "uuid": str(record.id),
             "version_id": record.revision_id + 1,
-            "metadata": deepcopy(dict(record.get("metadata", {}))),
+            "metadata": self._dump_metadata(record),
             "key": record.key,
         }
         access = record.get("access")
@@ -60,6 +68,21 @@ class PartialFileDumper(Dumper):
             data.update(record.file.dumps())
         return data
 
+    def _dump_metadata(self, record):
+        """Copy the metadata of a file record.
+
+        The metadata of the previous dump is reused instead if it is equal,
+        since comparing the metadata is much cheaper than copying it. It is
+        only reused if it is not the file record's own metadata (i.e. if the
+        file record was not loaded from that dump), so that the dump never
+        shares data with the file record.
+        """
+        metadata = record.get("metadata", {})
+        previous = self._previous.get("metadata")
+        if previous is not None and previous is not metadata and previous == metadata:
+            return previous
+        return deepcopy(dict(metadata))
+
     def load(self, data, record_cls):
         """Load a record from the source document of a search engine hit."""
         model_data = {
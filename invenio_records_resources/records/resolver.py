@@ -13,6 +13,7 @@ import uuid
 from invenio_db import db
 from invenio_pidstore.errors import PIDDeletedError
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_pidstore.resolver import Resolver
 
 
 class UUIDResolver(object):
@@ -79,3 +80,73 @@ class ModelResolver(object):
             # get record and pid
             record = self._record_cls(obj.data, model=obj)
             return (record.pid, record)
+
+
+class PIDRecordResolver(Resolver):
+    """Resolver fetching the PID and the record in a single query.
+
+    The PID table is joined with the table of the record model, and only
+    PIDs that can be resolved (i.e. registered, or also new/reserved if
+    ``registered_only`` is false) are selected. In any other case (unknown,
+    deleted or redirected PIDs, deleted records...), resolution falls back to
+    the PIDStore resolver so that the same errors are raised.
+
+    .. code-block:: python
+
+        class Record(RecordBase):
+            pid = PIDField(..., resolver_cls=PIDRecordResolver)
+    """
+
+    def __init__(
+        self,
+        pid_type=None,
+        object_type=None,
+        getter=None,
+        registered_only=True,
+        record_cls=None,
+    ):
+        """Initialize resolver.
+
+        :param record_cls: The record class. Defaults to the class of the
+            ``getter`` (i.e. ``Record.get_record``).
+        """
+        super().__init__(
+            pid_type=pid_type,
+            object_type=object_type,
+            getter=getter,
+            registered_only=registered_only,
+        )
+        self.record_cls = record_cls or getattr(getter, "__self__", None)
+
+    def resolve(self, pid_value):
+        """Resolve a persistent identifier and its record.
+
+        :param pid_value: Persistent identifier.
+        :returns: A tuple containing (pid, record).
+        """
+        model_cls = self.record_cls.model_cls
+        statuses = [PIDStatus.REGISTERED]
+        if not self.registered_only:
+            statuses += [PIDStatus.NEW, PIDStatus.RESERVED]
+
+        with db.session.no_autoflush:
+            query = (
+                db.session.query(PersistentIdentifier, model_cls)
+                .join(model_cls, model_cls.id == PersistentIdentifier.object_uuid)
+                .filter(
+                    PersistentIdentifier.pid_type == self.pid_type,
+                    PersistentIdentifier.pid_value == pid_value,
+                    PersistentIdentifier.status.in_(statuses),
+                )
+            )
+            if self.object_type:
+                query = query.filter(
+                    PersistentIdentifier.object_type == self.object_type
+                )
+            row = query.one_or_none()
+
+        if row is None or row[1].is_deleted:
+            return super().resolve(pid_value)
+
+        pid, obj = row
+        return pid, self.record_cls(obj.data, model=obj)
@@ -50,7 +50,7 @@ from invenio_records.systemfields import SystemField
 
 from ....services.records.components.files import FilesAttrConfig
 from ...dumpers import PartialFileDumper
-from .manager import FilesManager
+from .manager import FilesManager, LazyFileEntries
 
 
 class FilesField(SystemField):
@@ -203,16 +203,21 @@ class FilesField(SystemField):
         entries = None
         if self._store or from_dump:
             # If file entries where stored in the database record, or dumped
-            # into the index they will be loaded here.
-            entries = {}
-            for key, file_data in data.get("entries", {}).items():
+            # into the index they will be loaded here, only once accessed.
+            record_id = record.id
+            bucket_id = getattr(record, self._bucket_id_attr)
+
+            def _load_entry(file_data):
                 # Inject record_id/bucket_id here to avoid storing it
                 # redundantly for each file.
-                file_data["record_id"] = record.id
-                file_data["bucket_id"] = getattr(record, self._bucket_id_attr)
-                entries[key] = self.file_cls.loads(
-                    file_data, loader=PartialFileDumper()
-                )
+                file_data = {
+                    **file_data,
+                    "record_id": record_id,
+                    "bucket_id": bucket_id,
+                }
+                return self.file_cls.loads(file_data, loader=PartialFileDumper())
+
+            entries = LazyFileEntries(data.get("entries", {}), _load_entry)
 
         return FilesManager(
             record=record,
@@ -240,9 +245,10 @@ class FilesField(SystemField):
             data["totalbytes"] = files.total_bytes
             data["types"] = files.exts
             data["entries"] = {}
+            previous = (record.get(self.key) or {}).get("entries") or {}
             for file_record in files.values():
                 data["entries"][file_record.key] = file_record.dumps(
-                    dumper=PartialFileDumper()
+                    dumper=PartialFileDumper(previous.get(file_record.key))
                 )
         return data
 
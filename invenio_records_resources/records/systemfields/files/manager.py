@@ -51,18 +51,25 @@ necessarily persisted in the metadata.
 """
 
 import uuid
+from collections import Counter
 from collections.abc import MutableMapping
 from datetime import datetime
 from functools import wraps
 
+from flask import current_app
 from invenio_db import db
 from invenio_files_rest.errors import (
     BucketLockedError,
     InvalidKeyError,
     InvalidOperationError,
 )
-from invenio_files_rest.models import Bucket, FileInstance, ObjectVersion
-from sqlalchemy import insert
+from invenio_files_rest.models import (
+    Bucket,
+    FileInstance,
+    ObjectVersion,
+    ObjectVersionTag,
+)
+from sqlalchemy import bindparam, insert, null, update
 
 
 def ensure_enabled(func):
@@ -77,6 +84,105 @@ def ensure_enabled(func):
     return inner
 
 
+class FilesAggregates:
+    """Aggregated values of files, updated incrementally as files change.
+
+    The size, mimetype and extension of each file are kept, so that a changed
+    or removed file can be subtracted from the aggregates.
+    """
+
+    def __init__(self, entries=None):
+        """Initialize the aggregates from file records by key."""
+        self.total_bytes = 0
+        self._files = {}
+        self._mimetypes = Counter()
+        self._exts = Counter()
+        for key, rf in (entries or {}).items():
+            self.set(key, rf)
+
+    def set(self, key, rf):
+        """Add or replace the values of a file record."""
+        self.remove(key)
+        f = rf.file
+        if not f:
+            return
+        size, mimetype, ext = f.size or 0, f.mimetype, f.ext
+        self._files[key] = (size, mimetype, ext)
+        self.total_bytes += size
+        self._mimetypes[mimetype] += 1
+        if ext is not None:
+            self._exts[ext] += 1
+
+    def remove(self, key):
+        """Remove the values of a file record."""
+        values = self._files.pop(key, None)
+        if values is None:
+            return
+        size, mimetype, ext = values
+        self.total_bytes -= size
+        self._mimetypes -= Counter([mimetype])
+        if ext is not None:
+            self._exts -= Counter([ext])
+
+    @property
+    def mimetypes(self):
+        """List of mimetypes."""
+        return list(self._mimetypes)
+
+    @property
+    def exts(self):
+        """List of file extensions."""
+        return list(self._exts)
+
+
+class LazyFileEntries(MutableMapping):
+    """File entries which are only loaded from their dumps when accessed.
+
+    Checking if a key exists, or iterating over the keys, does not load any
+    file record.
+    """
+
+    def __init__(self, dumps, loader):
+        """Initialize the entries.
+
+        :param dumps: Dumps of the file records by key.
+        :param loader: Function loading a file record from its dump.
+        """
+        self._entries = dict(dumps)
+        self._dumps = set(self._entries)
+        self._loader = loader
+
+    def __getitem__(self, key):
+        """Get a file record, loading it from its dump on first access."""
+        value = self._entries[key]
+        if key in self._dumps:
+            value = self._entries[key] = self._loader(value)
+            self._dumps.discard(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Set a file record."""
+        self._entries[key] = value
+        self._dumps.discard(key)
+
+    def __delitem__(self, key):
+        """Remove a file record."""
+        del self._entries[key]
+        self._dumps.discard(key)
+
+    def __contains__(self, key):
+        """Check if a key exists, without loading its file record."""
+        return key in self._entries
+
+    def __iter__(self):
+        """Iterate over the keys."""
+        return iter(self._entries)
+
+    def __len__(self):
+        """Number of entries."""
+        return len(self._entries)
+
+
 class FilesManager(MutableMapping):
     """Files management dict-like wrapper."""
 
@@ -101,6 +207,11 @@ class FilesManager(MutableMapping):
         self._order = order or []
         self._default_preview = default_preview
         self._entries = entries
+        self._aggregates = None
+        # Keys known not to exist. Once the entries are loaded from the DB (and
+        # not from a dump), every missing key is known not to exist.
+        self._missing = set()
+        self._complete = False
 
     def create_bucket(self):
         """Create a bucket."""
@@ -174,8 +285,120 @@ class FilesManager(MutableMapping):
             rf.update(data)
         rf.commit()
         self._entries[key] = rf
+        self._missing.discard(key)
+        self._track(key, rf)
         return rf
 
+    @ensure_enabled
+    def create_many(self, files):
+        """Create/initialize many files at once.
+
+        The keys are checked against the existing files once, and the file
+        records (and the object versions and file instances of the files with
+        a location) are inserted with a single statement each. As for
+        ``create()``, the extensions of the file record class run and the file
+        records are validated, one at a time before the insert.
+
+        :param files: List of ``(key, data, obj)`` tuples, where ``obj`` is
+            ``None`` or a dictionary with the location of the file under
+            ``file`` (as for ``create()``).
+        :returns: The created file records.
+        """
+        keys = set(self.entries)
+        for key, _, _ in files:
+            if key in keys:
+                raise InvalidKeyError(
+                    description=f"File with key {key} already exists."
+                )
+            keys.add(key)
+
+        now = datetime.utcnow()
+        file_instances, object_versions, file_records = [], [], []
+        for key, data, obj in files:
+            rf = {
+                "id": uuid.uuid4(),
+                "created": now,
+                "updated": now,
+                "key": key,
+                "record_id": self.record.id,
+                "version_id": 1,
+                "object_version_id": None,
+            }
+            if obj:
+                file_ = obj["file"]
+                fi = {
+                    "id": uuid.uuid4(),
+                    "created": now,
+                    "updated": now,
+                    "uri": file_["uri"],
+                    "size": file_.get("size"),
+                    "checksum": file_.get("checksum"),
+                    "readable": True,
+                    "writable": False,
+                    "storage_class": file_.get("storage_class")
+                    or current_app.config["FILES_REST_DEFAULT_STORAGE_CLASS"],
+                }
+                ov = {
+                    "version_id": uuid.uuid4(),
+                    "created": now,
+                    "updated": now,
+                    "key": key,
+                    "bucket_id": self.bucket_id,
+                    "file_id": fi["id"],
+                    "is_head": True,
+                }
+                rf["object_version_id"] = ov["version_id"]
+                file_instances.append(fi)
+                object_versions.append(ov)
+            rf["json"] = self._validate_new_file(rf, data)
+            file_records.append(rf)
+
+        if not file_records:
+            return []
+
+        if object_versions:
+            if self.bucket.locked:
+                raise BucketLockedError()
+            # The new object versions become the head of their keys
+            ObjectVersion.query.filter(
+                ObjectVersion.bucket_id == self.bucket_id,
+                ObjectVersion.key.in_([ov["key"] for ov in object_versions]),
+                ObjectVersion.is_head.is_(True),
+            ).update({ObjectVersion.is_head: False}, synchronize_session=False)
+            db.session.execute(insert(FileInstance), file_instances)
+            db.session.execute(insert(ObjectVersion), object_versions)
+            self.bucket.size += sum(fi["size"] or 0 for fi in file_instances)
+
+        db.session.execute(insert(self.file_cls.model_cls), file_records)
+
+        keys = [rf["key"] for rf in file_records]
+        created = {rf.key: rf for rf in self.file_cls.get_by_keys(self.record.id, keys)}
+        for key in keys:
+            for e in self.file_cls._extensions:
+                e.post_create(created[key])
+            for e in self.file_cls._extensions:
+                e.post_commit(created[key])
+            self._entries[key] = created[key]
+            self._missing.discard(key)
+            self._track(key, created[key])
+        return [created[key] for key in keys]
+
+    def _validate_new_file(self, values, data):
+        """Run the create extensions of a new file record and validate it.
+
+        :param values: The column values of the file record.
+        :returns: The encoded JSON of the file record.
+        """
+        model = self.file_cls.model_cls(
+            **{k: v for k, v in values.items() if k != "version_id"}
+        )
+        rf = self.file_cls(dict(data or {}), model=model)
+        for e in self.file_cls._extensions:
+            e.pre_create(rf)
+        for e in self.file_cls._extensions:
+            e.pre_commit(rf)
+        return rf._validate()
+
     @ensure_enabled
     def create_obj(self, key, stream, data=None, **kwargs):
         """Create an ObjectVersion but do not pop it to the top of the stack."""
@@ -201,6 +424,7 @@ class FilesManager(MutableMapping):
         if data:
             rf.update(data)
         rf.commit()
+        self._track(key, rf)
         return rf
 
     @ensure_enabled
@@ -235,6 +459,7 @@ class FilesManager(MutableMapping):
             else:
                 rf.object_version.remove()
         del self._entries[key]
+        self._track(key)
 
         # Unset the default preview if the file is removed
         if self.default_preview == key:
@@ -245,14 +470,111 @@ class FilesManager(MutableMapping):
 
     @ensure_enabled
     def delete_all(self, remove_obj=True, softdelete_obj=True, remove_rf=False):
-        """Delete all file records."""
-        for key in list(self.keys()):
-            self.delete(
-                key,
-                remove_obj=remove_obj,
-                softdelete_obj=softdelete_obj,
-                remove_rf=remove_rf,
+        """Delete all file records.
+
+        Same as calling ``delete()`` for each file, but the file records and
+        object versions are deleted with a constant number of statements. The
+        extensions of the file records are not called.
+
+        :returns: The deleted file records.
+        """
+        return self._delete_many(
+            list(self.entries),
+            remove_obj=remove_obj,
+            softdelete_obj=softdelete_obj,
+            remove_rf=remove_rf,
+        )
+
+    def _delete_many(self, keys, remove_obj=True, softdelete_obj=True, remove_rf=False):
+        """Delete many file records at once.
+
+        The file records and object versions are deleted with a constant number
+        of statements, see ``delete_all()``.
+
+        :returns: The deleted file records.
+        """
+        deleted = [self.entries[key] for key in keys]
+        if not deleted:
+            return []
+
+        model_cls = self.file_cls.model_cls
+        query = model_cls.query.filter(model_cls.id.in_([rf.id for rf in deleted]))
+        if remove_rf:
+            query.delete(synchronize_session="fetch")
+        else:
+            query.update(
+                {
+                    model_cls.json: null(),
+                    model_cls.version_id: model_cls.version_id + 1,
+                },
+                synchronize_session="fetch",
+            )
+
+        object_versions = [rf.object_version for rf in deleted if rf.object_version]
+        if object_versions and remove_obj:
+            if self.bucket.locked:
+                raise BucketLockedError()
+            if softdelete_obj:
+                self._softdelete_objs([ov.key for ov in object_versions])
+            else:
+                self.bucket.size -= sum(
+                    ov.file.size or 0 for ov in object_versions if ov.file
+                )
+                ObjectVersion.query.filter(
+                    ObjectVersion.version_id.in_(
+                        [ov.version_id for ov in object_versions]
+                    )
+                ).delete(synchronize_session="fetch")
+
+        for key in keys:
+            del self._entries[key]
+            self._track(key)
+        if self.default_preview in keys:
+            self.default_preview = None
+        self._order = [key for key in self._order if key not in keys]
+        return deleted
+
+    def _softdelete_objs(self, keys):
+        """Soft delete the head object versions of keys of the bucket.
+
+        As ``ObjectVersion.delete()``, but for many keys: a delete marker
+        becomes the head of each key with a file.
+        """
+        heads = (
+            db.session.query(
+                ObjectVersion.version_id, ObjectVersion.key, FileInstance.size
+            )
+            .join(FileInstance, ObjectVersion.file_id == FileInstance.id)
+            .filter(
+                ObjectVersion.bucket_id == self.bucket_id,
+                ObjectVersion.key.in_(keys),
+                ObjectVersion.is_head.is_(True),
             )
+            .all()
+        )
+        if not heads:
+            return
+
+        ObjectVersion.query.filter(
+            ObjectVersion.version_id.in_([version_id for version_id, _, _ in heads])
+        ).update({ObjectVersion.is_head: False}, synchronize_session="fetch")
+        now = datetime.utcnow()
+        db.session.execute(
+            insert(ObjectVersion),
+            [
+                {
+                    "version_id": uuid.uuid4(),
+                    "created": now,
+                    "updated": now,
+                    "key": key,
+                    "bucket_id": self.bucket_id,
+                    "file_id": None,
+                    "is_head": True,
+                }
+                for _, key, _ in heads
+            ],
+        )
+        self.bucket.size -= sum(size or 0 for _, _, size in heads)
 
     def teardown(self, full=True):
         """Clean up all file manager related instances.
@@ -268,13 +590,15 @@ class FilesManager(MutableMapping):
             self.remove_bucket(force=True)
         self.default_preview = None
         self._entries = None
+        self._aggregates = None
+        self._missing = set()
         self._order = []
 
     def copy(self, src_files, copy_obj=True):
         """Copy from another file manager.
 
-        This method will copy all object versions to the `self.bucket` assuming
-        that the latter is a new empty bucket.
+        If `self.bucket` is empty, all object versions are copied to it.
+        Otherwise, only the files missing or changed in `self.bucket` are copied.
         """
         self.enabled = src_files.enabled
 
@@ -305,30 +629,170 @@ class FilesManager(MutableMapping):
 
             if rf_to_bulk_insert:
                 db.session.execute(insert(self.file_cls.model_cls), rf_to_bulk_insert)
+                self._missing = set()
                 # we need to populate entries from DB so we store the record file model
                 # instance
                 if not self._entries:
-                    self._entries = {}
-                    for rf in self.file_cls.list_by_record(self.record.id):
-                        self._entries[rf.key] = rf
+                    self._entries = None
+                    self._aggregates = None
+                    self.entries
         else:
-            # if bucket is not empty then we fallback to the slow process of copying
-            # files
-            for key, rf in src_files.items():
-                # Copy object version of link existing?
-                if copy_obj:
-                    dst_obj = rf.object_version.copy(bucket=self.bucket)
-                else:
-                    dst_obj = rf.object_version
-
-                # Copy file record
-                if rf.metadata is not None:
-                    self[key] = dst_obj, dict(rf)
-                else:
-                    self[key] = dst_obj
+            # if bucket is not empty then only the missing or changed files are
+            # copied
+            self._copy_files(src_files, copy_obj=copy_obj)
         self.default_preview = src_files.default_preview
         self.order = src_files.order
 
+    def _copy_files(self, src_files, copy_obj=True):
+        """Copy the files missing or changed from another file manager.
+
+        The object versions of the missing or changed files are copied, and
+        their file records inserted or updated, with a single statement each.
+        """
+        entries = self.entries
+        src_objs = {
+            key: rf.object_version
+            for key, rf in src_files.items()
+            if rf.object_version and rf.object_version.file_id
+        }
+        if copy_obj:
+            obj_ids, to_copy = {}, []
+            for key, ov in src_objs.items():
+                dest_ov = entries[key].object_version if key in entries else None
+                # the entries loaded from a dump have string IDs
+                if dest_ov is not None and str(dest_ov.file_id) == str(ov.file_id):
+                    obj_ids[key] = dest_ov.version_id
+                else:
+                    to_copy.append(ov)
+            obj_ids.update(self._copy_objs(to_copy))
+        else:
+            obj_ids = {key: ov.version_id for key, ov in src_objs.items()}
+
+        self._set_many(
+            [
+                (key, dict(rf) if rf.metadata is not None else {}, obj_ids.get(key))
+                for key, rf in src_files.items()
+            ]
+        )
+
+    def _set_many(self, files):
+        """Create or update many file records at once.
+
+        The missing file records are inserted, and the changed ones updated,
+        with a single statement each.
+
+        :param files: List of ``(key, data, object_version_id)`` tuples. The data
+            is merged into the existing file records, which keep their object
+            version if ``object_version_id`` is ``None``.
+        """
+        entries = self.entries
+        now = datetime.utcnow()
+        new_rfs, changed_rfs = [], []
+        for key, data, obj_id in files:
+            dest_rf = entries.get(key)
+            if dest_rf is None:
+                new_rfs.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "created": now,
+                        "updated": now,
+                        "key": key,
+                        "record_id": self.record.id,
+                        "version_id": 1,
+                        "object_version_id": obj_id,
+                        "json": data,
+                    }
+                )
+                continue
+            json = {**dict(dest_rf), **data}
+            obj_id = obj_id or dest_rf.object_version_id
+            # the entries loaded from a dump have string IDs
+            if json != dict(dest_rf) or str(obj_id) != str(dest_rf.object_version_id):
+                changed_rfs.append((dest_rf, json, obj_id))
+
+        if new_rfs:
+            db.session.execute(insert(self.file_cls.model_cls), new_rfs)
+        self._update_many(changed_rfs)
+        if new_rfs or changed_rfs:
+            # populate the entries from the DB again, to get the models
+            self._entries = None
+            self._aggregates = None
+
+    def _copy_objs(self, objs):
+        """Copy object versions (and their tags) to the bucket at once.
+
+        As ``ObjectVersion.copy()`` for each object version, the copies become
+        the head of their keys.
+
+        :returns: The version IDs of the copies by key.
+        """
+        if not objs:
+            return {}
+        if self.bucket.locked:
+            raise BucketLockedError()
+
+        now = datetime.utcnow()
+        copies = {
+            ov.version_id: {
+                "version_id": uuid.uuid4(),
+                "created": now,
+                "updated": now,
+                "key": ov.key,
+                "bucket_id": self.bucket_id,
+                "file_id": ov.file_id,
+                "is_head": True,
+            }
+            for ov in objs
+        }
+        tags = [
+            {
+                "version_id": copies[tag.version_id]["version_id"],
+                "key": tag.key,
+                "value": tag.value,
+            }
+            for tag in ObjectVersionTag.query.filter(
+                ObjectVersionTag.version_id.in_(list(copies))
+            )
+        ]
+
+        ObjectVersion.query.filter(
+            ObjectVersion.bucket_id == self.bucket_id,
+            ObjectVersion.key.in_([ov.key for ov in objs]),
+            ObjectVersion.is_head.is_(True),
+        ).update({ObjectVersion.is_head: False}, synchronize_session="fetch")
+        db.session.execute(insert(ObjectVersion), list(copies.values()))
+        if tags:
+            db.session.execute(insert(ObjectVersionTag), tags)
+        self.bucket.size += sum(ov.file.size or 0 for ov in objs)
+        return {copy["key"]: copy["version_id"] for copy in copies.values()}
+
+    def _update_many(self, changes):
+        """Update the JSON and object version of file records at once.
+
+        :param changes: List of ``(rf, json, object_version_id)`` tuples.
+        """
+        if not changes:
+            return
+        table = self.file_cls.model_cls.__table__
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(
+                json=bindparam("_json"),
+                object_version_id=bindparam("_object_version_id"),
+                version_id=table.c.version_id + 1,
+                updated=datetime.utcnow(),
+            ),
+            [
+                {"_id": rf.id, "_json": json, "_object_version_id": obj_id}
+                for rf, json, obj_id in changes
+            ],
+        )
+        # the models in the session are out of date
+        for rf, _, _ in changes:
+            if rf.model in db.session:
+                db.session.expire(rf.model)
+
     def sync(self, src_files, delete_extras=True):
         """Sync changes from source files to this manager.
 
@@ -342,41 +806,50 @@ class FilesManager(MutableMapping):
            True
         Logic follows the bucket sync logic
         """
-        # TODO record file data is not synced
-        self.default_preview = src_files.default_preview
-        self.order = src_files.order
-
         # Sync file additions/removals/changes
         if self.bucket.locked:
             raise BucketLockedError()
 
         _, changed_ovs = src_files.bucket.sync(self.bucket, delete_extras=delete_extras)
 
-        for operation, obj_or_key in changed_ovs:
-            if operation == "delete":
-                # delete key of deleted ov if not already
-                # sync method returns all records even the already deleted ones
-                # thus we need to check if key is present
-                if obj_or_key in self:
-                    del self[obj_or_key]
-            elif operation == "add":
-                f_key = obj_or_key.key
-                rf = src_files[f_key]
-                if rf.metadata is not None:
-                    self[f_key] = obj_or_key, dict(rf)
-                else:
-                    self[f_key] = obj_or_key
-
+        # The entries are checked instead of the manager, to avoid a lookup in
+        # the DB of each key.
+        entries, src_entries = self.entries, src_files.entries
+        # sync method returns all records even the already deleted ones, and
+        # the object versions are already deleted
+        deleted = {key for operation, key in changed_ovs if operation == "delete"}
+        self._delete_many([key for key in deleted if key in entries], remove_obj=False)
+
+        files = {}
+        for operation, obj in changed_ovs:
+            if operation == "add":
+                rf = src_entries[obj.key]
+                data = dict(rf) if rf.metadata is not None else {}
+                files[obj.key] = (obj.key, data, obj.version_id)
         # Check for metadata and access changes
-        for key, dest_rf in self.entries.items():
-            if key in src_files:
-                src_rf = src_files[key]
-                if (
-                    src_rf.metadata != dest_rf.metadata
-                    or src_rf.access != dest_rf.access
-                ):
-                    obj_or_key = dest_rf.object_version
-                    self[key] = obj_or_key, dict(src_rf)
+        for key in entries:
+            if key in src_entries and key not in files:
+                files[key] = (key, dict(src_entries[key]), None)
+        self._set_many(list(files.values()))
+
+        self.default_preview = src_files.default_preview
+        self.order = src_files.order
+
+    def _track(self, key, rf=None):
+        """Update the aggregates for a changed (or removed) file record."""
+        if self._aggregates is None:
+            return
+        if rf is None:
+            self._aggregates.remove(key)
+        else:
+            self._aggregates.set(key, rf)
+
+    @property
+    def aggregates(self):
+        """Aggregated values of the files (computed once, then kept updated)."""
+        if self._aggregates is None:
+            self._aggregates = FilesAggregates(self.entries)
+        return self._aggregates
 
     @property
     def entries(self):
@@ -385,6 +858,8 @@ class FilesManager(MutableMapping):
             self._entries = {}
             for rf in self.file_cls.list_by_record(self.record.id):
                 self._entries[rf.key] = rf
+            self._missing = set()
+            self._complete = True
         return self._entries
 
     @property
@@ -419,23 +894,17 @@ class FilesManager(MutableMapping):
     @property
     def total_bytes(self):
         """Return total number of bytes."""
-        return sum([f.file.size for f in self.entries.values() if f.file])
+        return self.aggregates.total_bytes
 
     @property
     def mimetypes(self):
         """Return list of mimetypes."""
-        return list({f.file.mimetype for f in self.entries.values() if f.file})
+        return self.aggregates.mimetypes
 
     @property
     def exts(self):
         """Return list file extensions."""
-        return list(
-            {
-                f.file.ext
-                for f in self.entries.values()
-                if f.file and f.file.ext is not None
-            }
-        )
+        return self.aggregates.exts
 
     @property
     def default_preview(self):
@@ -468,13 +937,26 @@ class FilesManager(MutableMapping):
         value = self.entries.get(key)
         if isinstance(value, self.file_cls):
             return value
-        else:  # fetch from db...
+        elif not self._complete and key not in self._missing:  # fetch from db...
             value = self.file_cls.get_by_key(self.record.id, key)
             if value:
                 self._entries[key] = value
+                self._track(key, value)
                 return value
+            self._missing.add(key)
         raise KeyError(f'No file with key "{key}"')
 
+    @ensure_enabled
+    def __contains__(self, key):
+        """Check if a file exists (without loading the entry if present)."""
+        if key in self.entries:
+            return True
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
     def _parse_set_value(self, value):
         obj, stream, data = None, None, None
         # TODO: Raise appropriate exceptions instead of asserting
@@ -35,9 +35,11 @@ key in the record:
 
 """
 
+from collections import namedtuple
+
 from invenio_db import db
-from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_pidstore.models import PersistentIdentifier
+from invenio_pidstore.errors import PIDDoesNotExistError, ResolverError
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_pidstore.resolver import Resolver
 from invenio_records.systemfields import (
     ModelField,
@@ -45,11 +47,18 @@ from invenio_records.systemfields import (
     RelatedModelFieldContext,
 )
 from sqlalchemy import inspect
+from sqlalchemy.orm.exc import NoResultFound
 
 from ..api import PersistentIdentifierWrapper
+from ..cache import current_read_cache
 from ..providers import ModelPIDProvider
 from ..resolver import ModelResolver
 
+RecordProbe = namedtuple(
+    "RecordProbe", ["id", "revision_id", "is_deleted", "pid_status"]
+)
+"""Revision metadata of a record, fetched without loading its JSON."""
+
 
 class PIDFieldContext(RelatedModelFieldContext):
     """PIDField context.
@@ -65,6 +74,16 @@ class PIDFieldContext(RelatedModelFieldContext):
 
     def resolve(self, pid_value, registered_only=True, with_deleted=False):
         """Resolve identifier."""
+        read_cache = current_read_cache() if self.field._read_cache else None
+        if read_cache is not None:
+            # Only registered PIDs of non-deleted records are cached, which
+            # satisfies any combination of the arguments.
+            cached = read_cache.get(self.record_cls, self.field._pid_type, pid_value)
+            if cached is not None:
+                pid, record = cached
+                self.field._set_cache(record, pid)
+                return record
+
         # Create resolver
         resolver = self.field._resolver_cls(
             pid_type=self.field._pid_type,
@@ -85,8 +104,150 @@ class PIDFieldContext(RelatedModelFieldContext):
         # Store pid in cache on record.
         self.field._set_cache(record, pid)
 
+        if read_cache is not None and pid.status == PIDStatus.REGISTERED:
+            read_cache.set(self.record_cls, pid, record)
+
         return record
 
+    def _query_many(self):
+        """Check if many identifiers can be fetched from the PIDStore at once.
+
+        Contexts which override ``resolve()`` (e.g. taking the PID type from
+        the context), fields without a PID type and resolvers not using the
+        PIDStore are resolved one by one instead.
+        """
+        return (
+            type(self).resolve is PIDFieldContext.resolve
+            and self.field._pid_type is not None
+            and issubclass(self.field._resolver_cls, Resolver)
+        )
+
+    def _resolve_one(self, pid_value, **kwargs):
+        """Resolve an identifier, with the arguments of the base context only."""
+        if type(self).resolve is not PIDFieldContext.resolve:
+            return self.resolve(pid_value)
+        return self.resolve(pid_value, **kwargs)
+
+    def resolve_many(self, pid_values, registered_only=True):
+        """Resolve many identifiers in a single query.
+
+        Identifiers which cannot be resolved (e.g. unknown, unregistered or
+        deleted PIDs, and deleted records) are missing from the result.
+
+        :returns: A dict of records by PID value.
+        """
+        pid_values = set(pid_values)
+        if not pid_values:
+            return {}
+        if not self._query_many():
+            return self._resolve_many_one_by_one(pid_values, registered_only)
+
+        model_cls = self.record_cls.model_cls
+        statuses = [PIDStatus.REGISTERED]
+        if not registered_only:
+            statuses += [PIDStatus.NEW, PIDStatus.RESERVED]
+
+        with db.session.no_autoflush:
+            query = (
+                db.session.query(PersistentIdentifier, model_cls)
+                .join(model_cls, model_cls.id == PersistentIdentifier.object_uuid)
+                .filter(
+                    PersistentIdentifier.pid_type == self.field._pid_type,
+                    PersistentIdentifier.pid_value.in_(pid_values),
+                    PersistentIdentifier.status.in_(statuses),
+                    model_cls.is_deleted != True,  # noqa
+                )
+            )
+            if self.field._object_type:
+                query = query.filter(
+                    PersistentIdentifier.object_type == self.field._object_type
+                )
+            rows = query.all()
+
+        records = {}
+        for pid, obj in rows:
+            record = self.record_cls(obj.data, model=obj)
+            self.field._set_cache(record, pid)
+            records[pid.pid_value] = record
+        return records
+
+    def _resolve_many_one_by_one(self, pid_values, registered_only):
+        """Resolve records which cannot be fetched at once."""
+        records = {}
+        for pid_value in pid_values:
+            try:
+                records[pid_value] = self._resolve_one(
+                    pid_value, registered_only=registered_only
+                )
+            except (PIDDoesNotExistError, ResolverError, NoResultFound):
+                continue
+        return records
+
+    def probe(self, pid_value):
+        """Fetch the revision metadata of the record of an identifier.
+
+        :returns: A ``RecordProbe`` or ``None`` if the PID is unknown or not
+            assigned to a record.
+        """
+        return self.probe_many([pid_value]).get(pid_value)
+
+    def probe_many(self, pid_values):
+        """Fetch the revision metadata of the records of many identifiers.
+
+        Only the id, version and deletion flag of the records (and the status
+        of their PIDs) are selected, i.e. not the records' JSON. PIDs which are
+        unknown or not assigned to a record are missing from the result.
+
+        :returns: A dict of ``RecordProbe`` by PID value.
+        """
+        pid_values = set(pid_values)
+        if not pid_values:
+            return {}
+        if not self._query_many():
+            return self._probe_many_by_resolving(pid_values)
+
+        model_cls = self.record_cls.model_cls
+        with db.session.no_autoflush:
+            query = (
+                db.session.query(
+                    PersistentIdentifier.pid_value,
+                    PersistentIdentifier.status,
+                    model_cls.id,
+                    model_cls.version_id,
+                    model_cls.is_deleted,
+                )
+                .join(model_cls, model_cls.id == PersistentIdentifier.object_uuid)
+                .filter(
+                    PersistentIdentifier.pid_type == self.field._pid_type,
+                    PersistentIdentifier.pid_value.in_(pid_values),
+                )
+            )
+            if self.field._object_type:
+                query = query.filter(
+                    PersistentIdentifier.object_type == self.field._object_type
+                )
+            rows = query.all()
+
+        return {
+            pid_value: RecordProbe(id_, version_id - 1, bool(is_deleted), status)
+            for pid_value, status, id_, version_id, is_deleted in rows
+        }
+
+    def _probe_many_by_resolving(self, pid_values):
+        """Probe records which cannot be fetched at once."""
+        probes = {}
+        for pid_value in pid_values:
+            try:
+                record = self._resolve_one(
+                    pid_value, registered_only=False, with_deleted=True
+                )
+            except (PIDDoesNotExistError, ResolverError, NoResultFound):
+                continue
+            probes[pid_value] = RecordProbe(
+                record.id, record.revision_id, record.is_deleted, record.pid.status
+            )
+        return probes
+
 
 class PIDField(RelatedModelField):
     """Persistent identifier system field."""
@@ -101,6 +262,7 @@ class PIDField(RelatedModelField):
         delete=True,
         create=True,
         context_cls=PIDFieldContext,
+        read_cache=False,
     ):
         """Initialize the PIDField.
 
@@ -113,6 +275,8 @@ class PIDField(RelatedModelField):
         :param resolver_cls: The resolver class to use for resolving the PID.
         :param delete: Set to True of pid should be automatically deleted.
         :param create: Set to True of pid should be automatically created.
+        :param read_cache: Set to True to resolve records through the read
+            cache (see ``RECORDS_RESOURCES_READ_CACHE_*`` config).
         """
         self._provider = provider
         self._pid_type = provider.pid_type if provider else pid_type
@@ -120,6 +284,7 @@ class PIDField(RelatedModelField):
         self._resolver_cls = resolver_cls or Resolver
         self._delete = delete
         self._create = create
+        self._read_cache = read_cache
         super().__init__(
             PersistentIdentifier,
             key=key,
@@ -226,6 +391,28 @@ class ModelPIDFieldContext(PIDFieldContext):
 
         return record
 
+    def probe_many(self, pid_values):
+        """Fetch the revision metadata of the records of many identifiers."""
+        pid_values = set(pid_values)
+        if not pid_values:
+            return {}
+        model_cls = self.record_cls.model_cls
+        pid_column = getattr(model_cls, self.field.model_field_name)
+        with db.session.no_autoflush:
+            rows = (
+                db.session.query(
+                    pid_column, model_cls.id, model_cls.version_id, model_cls.is_deleted
+                )
+                .filter(pid_column.in_(pid_values))
+                .all()
+            )
+        return {
+            pid_value: RecordProbe(
+                id_, version_id - 1, bool(is_deleted), PIDStatus.REGISTERED
+            )
+            for pid_value, id_, version_id, is_deleted in rows
+        }
+
     def create(self, record):
         """Method to create a new persistent identifier for the record."""
         # pop from metadata
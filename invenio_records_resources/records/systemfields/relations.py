@@ -10,41 +10,88 @@
 """Relations system field."""
 
 from invenio_db import db
-from invenio_pidstore.models import PersistentIdentifier
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records.systemfields.relations import (
     InvalidRelationValue,
     ListRelation,
     NestedListRelation,
     RelationBase,
+    RelationListResult,
+    RelationNestedListResult,
 )
 
+from ..cache import current_relation_cache
+
 
 class PIDRelation(RelationBase):
     """PID relation type."""
 
-    def __init__(self, *args, pid_field=None, **kwargs):
-        """Initialize the PK relation."""
+    def __init__(self, *args, pid_field=None, shared_cache=False, **kwargs):
+        """Initialize the PK relation.
+
+        :param shared_cache: Set to True to also keep the resolved records in
+            the process-wide relation cache (see
+            ``RECORDS_RESOURCES_RELATION_CACHE_*`` config).
+        """
         self.pid_field = pid_field
+        self.shared_cache = shared_cache
         super().__init__(*args, **kwargs)
 
+    def _get_shared_cache(self):
+        """Get the process-wide relation cache, if enabled."""
+        return current_relation_cache() if self.shared_cache else None
+
+    def _cache_resolved(self, id_, obj, shared_cache):
+        """Cache a record resolved from the database."""
+        if shared_cache is not None:
+            shared_cache.set(self.pid_field.record_cls, id_, obj)
+        # We detach the related record model from the database session when
+        # we add it in the cache. Otherwise, accessing the cached record
+        # model, will execute a new select query after a db.session.commit.
+        db.session.expunge(obj.model)
+        self.cache[id_] = obj
+
     def resolve(self, id_):
         """Resolve the value using the record class."""
         if id_ in self.cache:
             obj = self.cache[id_]
             return obj
 
+        shared_cache = self._get_shared_cache()
+        if shared_cache is not None:
+            obj = shared_cache.get(self.pid_field.record_cls, id_)
+            if obj is not None:
+                self.cache[id_] = obj
+                return obj
+
         try:
             obj = self.pid_field.resolve(id_)
-            # We detach the related record model from the database session when
-            # we add it in the cache. Otherwise, accessing the cached record
-            # model, will execute a new select query after a db.session.commit.
-            db.session.expunge(obj.model)
-            self.cache[id_] = obj
+            self._cache_resolved(id_, obj, shared_cache)
             return obj
             # TODO: there's many ways PID resolution can fail...
         except Exception:
             return None
 
+    def resolve_many(self, ids):
+        """Resolve many values at once, using a single query for the misses.
+
+        :returns: A dict of the resolved records by ID.
+        """
+        missing = [id_ for id_ in set(ids) if id_ not in self.cache]
+
+        shared_cache = self._get_shared_cache()
+        if shared_cache is not None:
+            for id_ in list(missing):
+                obj = shared_cache.get(self.pid_field.record_cls, id_)
+                if obj is not None:
+                    self.cache[id_] = obj
+                    missing.remove(id_)
+
+        if missing:
+            for id_, obj in self.pid_field.resolve_many(missing).items():
+                self._cache_resolved(id_, obj, shared_cache)
+        return {id_: self.cache[id_] for id_ in ids if id_ in self.cache}
+
     def parse_value(self, value):
         """Parse a record (or ID) to the ID to be stored."""
         if isinstance(value, str):
@@ -60,19 +107,142 @@ class PIDRelation(RelationBase):
                 f'"{self.pid_field.record_cls}"'
             )
 
-    # TODO: We could have a more efficient "exists" via PK queries
-    # def exists(self, id_):
-    #     """Check if an ID exists using the record class."""
-    #     return bool(self.record_cls.model_cls.query.filter_by(id=id_))
-    #
-    # def exists_many(self, ids):
-    #     """."""
-    #     self.record_cls.get_record(id_)
+    def missing_ids(self, ids):
+        """Get the IDs which cannot be resolved, using a single query.
+
+        Only the PIDs and the revision metadata of the records are fetched
+        (see ``PIDFieldContext.probe_many()``), not the related records.
+        """
+        ids = set(ids)
+        unknown = ids - set(self.cache)
+        if not unknown:
+            return set()
+        probes = self.pid_field.probe_many(unknown)
+        return {
+            id_
+            for id_ in unknown
+            if id_ not in probes
+            or probes[id_].is_deleted
+            or probes[id_].pid_status != PIDStatus.REGISTERED
+        }
+
+    def exists(self, id_):
+        """Check if an ID exists, without resolving the related record."""
+        try:
+            return not self.missing_ids([id_])
+        except Exception:
+            return False
+
+    def exists_many(self, ids):
+        """Check if all IDs exist, using a single query."""
+        return not self.missing_ids(ids)
+
+
+class PIDExistsResultMixin:
+    """Validate all the related IDs of a record with a single query."""
+
+    def exists(self, id_):
+        """Check if an ID exists, using the IDs prefetched by validate()."""
+        missing = self.__dict__.get("_missing_ids")
+        if missing is None:
+            return self.field.exists(id_)
+        return id_ not in missing
+
+    def validate(self):
+        """Validate the field."""
+        try:
+            ids = _iter_relation_ids(
+                self._lookup_data(), self.field._value_key_suffix, all_ids=True
+            )
+            self._missing_ids = self.field.missing_ids(ids)
+        except (KeyError, TypeError):
+            # Let the validation report the invalid values
+            pass
+        try:
+            return super().validate()
+        finally:
+            self.__dict__.pop("_missing_ids", None)
+
+
+class PIDRelationListResult(PIDExistsResultMixin, RelationListResult):
+    """PID relation list access result."""
+
+
+class PIDRelationNestedListResult(PIDExistsResultMixin, RelationNestedListResult):
+    """PID relation nested list access result."""
 
 
 class PIDListRelation(ListRelation, PIDRelation):
     """PID list relation type."""
 
+    result_cls = PIDRelationListResult
+
 
 class PIDNestedListRelation(NestedListRelation, PIDRelation):
     """PID nested list relation type."""
+
+    result_cls = PIDRelationNestedListResult
+
+    def exists_many(self, ids):
+        """Check if all IDs of the nested lists exist, using a single query."""
+        return not self.missing_ids(id_ for inner_ids in ids for id_ in inner_ids)
+
+
+def _iter_relation_ids(data, key, all_ids=False):
+    """Iterate over the related IDs of (not yet dereferenced) objects."""
+    if isinstance(data, dict):
+        if key in data and (all_ids or "@v" not in data):
+            yield data[key]
+    elif isinstance(data, list):
+        for item in data:
+            yield from _iter_relation_ids(item, key, all_ids=all_ids)
+
+
+def dereference_many(records, key="relations", fields=None):
+    """Dereference the relations of many records.
+
+    The related IDs of all the records are gathered first, and resolved with a
+    single query per relation (relations of different types can share the
+    same related record class, e.g. vocabularies). Each record is then
+    dereferenced from the relation caches.
+
+    :param records: The records to dereference.
+    :param key: The name of the relations field on the records.
+    :param fields: The relations to dereference (defaults to all of them).
+    :raises InvalidRelationValue: If a related record cannot be resolved.
+    """
+    records = list(records)
+
+    # Gather the related IDs of all records
+    pending = {}
+    for record in records:
+        relations = getattr(record, key)
+        for name in fields or relations:
+            result = getattr(relations, name)
+            if not isinstance(result.field, PIDRelation):
+                continue
+            try:
+                data = result._lookup_data()
+            except KeyError:
+                continue
+            pending.setdefault(result.field, set()).update(
+                _iter_relation_ids(data, result.field._value_key_suffix)
+            )
+
+    # Resolve them with one query per relation
+    resolved = {}
+    for relation, ids in pending.items():
+        resolved[relation] = relation.resolve_many(ids)
+        missing = ids - set(resolved[relation])
+        if missing:
+            raise InvalidRelationValue(
+                f"Invalid value {sorted(missing)} for relation {relation.key}."
+            )
+
+    # Dereference each record from its relation caches
+    for record in records:
+        relations = getattr(record, key)
+        for name in fields or relations:
+            relation = getattr(relations, name).field
+            relation.cache.update(resolved.get(relation, {}))
+        relations.dereference(fields=fields)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Schemas for parameter parsing."""
+
+from flask_resources.parsers import MultiDictSchema
+from marshmallow import fields, validate
+
+from ...records.api import FileRecord
+
+
+class FileListRequestArgsSchema(MultiDictSchema):
+    """Request URL query string arguments of the files list."""
+
+    page = fields.Int(validate=validate.Range(min=1))
+    size = fields.Int(validate=validate.Range(min=1))
+    prefix = fields.String()
+    sort = fields.String(
+        validate=validate.OneOf(
+            [f"{d}{o}" for o in FileRecord.sort_options for d in ("", "-")]
+        )
+    )
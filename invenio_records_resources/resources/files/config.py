@@ -11,6 +11,8 @@
 
 from flask_resources import ResourceConfig
 
+from .args import FileListRequestArgsSchema
+
 
 class FileResourceConfig(ResourceConfig):
     """File resource config."""
@@ -27,3 +29,6 @@ class FileResourceConfig(ResourceConfig):
         "item-commit": "/files/<path:key>/commit",
         "list-archive": "/files-archive",
     }
+
+    # Request parsing
+    request_list_args = FileListRequestArgsSchema
@@ -18,6 +18,7 @@ from flask_resources import (
     JSONDeserializer,
     RequestBodyParser,
     Resource,
+    from_conf,
     request_body_parser,
     request_parser,
     resource_requestctx,
@@ -30,6 +31,7 @@ from zipstream import ZIP_STORED, ZipStream
 from invenio_records_resources.services.errors import FailedFileUploadException
 
 from ..errors import ErrorHandlersMixin
+from ..records.utils import add_etag_header, is_not_modified, not_modified_response
 from .parser import RequestStreamParser
 
 #
@@ -40,6 +42,8 @@ request_view_args = request_parser(
     location="view_args",
 )
 
+request_list_args = request_parser(from_conf("request_list_args"), location="args")
+
 request_data = request_body_parser(
     parsers={"application/json": RequestBodyParser(JSONDeserializer())},
     default_content_type="application/json",
@@ -87,12 +91,14 @@ class FileResource(ErrorHandlersMixin, Resource):
         return url_rules
 
     @request_view_args
+    @request_list_args
     @response_handler(many=True)
     def search(self):
         """List files."""
         files = self.service.list_files(
             g.identity,
             resource_requestctx.view_args["pid_value"],
+            params=resource_requestctx.args,
         )
         return files.to_dict(), 200
 
@@ -128,6 +134,13 @@ class FileResource(ErrorHandlersMixin, Resource):
             resource_requestctx.view_args["key"],
         )
 
+        # The tag changes whenever the file record is updated or its object
+        # version is replaced.
+        etag = f"{item._file.revision_id}-{item._file.object_version_id}"
+        if is_not_modified(etag):
+            return not_modified_response(etag), 304
+        add_etag_header(etag)
+
         return item.to_dict(), 200
 
     @request_view_args
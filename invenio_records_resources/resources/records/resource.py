@@ -24,7 +24,7 @@ from flask_resources import (
 from invenio_stats.proxies import current_stats
 
 from ..errors import ErrorHandlersMixin
-from .utils import search_preference
+from .utils import is_not_modified, not_modified_response, search_preference
 
 #
 # Decorators
@@ -103,12 +103,18 @@ class RecordResource(ErrorHandlersMixin, Resource):
     @response_handler()
     def read(self):
         """Read an item."""
+        expand = resource_requestctx.args.get("expand", False)
         item = self.service.read(
             g.identity,
             resource_requestctx.view_args["pid_value"],
-            expand=resource_requestctx.args.get("expand", False),
+            expand=expand,
         )
 
+        # Conditional request: answer with a 304 without dumping the record.
+        # Expanded fields depend on other records, hence are never matched.
+        if not expand and is_not_modified(item._record.revision_id):
+            return not_modified_response(item._record.revision_id), 304
+
         # we emit the record view stats event here rather than in the service because
         # the service might be called from other places as well that we don't want
         # to count, e.g. from some CLI commands
@@ -11,7 +11,8 @@
 
 import hashlib
 
-from flask import request
+from flask import Response, after_this_request, request
+from werkzeug.http import quote_etag
 
 
 def search_preference():
@@ -22,3 +23,22 @@ def search_preference():
     alg = hashlib.md5()
     alg.update(user_hash)
     return alg.hexdigest()
+
+
+def is_not_modified(etag):
+    """Check if the ``If-None-Match`` header of the request matches the etag."""
+    return etag is not None and request.if_none_match.contains(str(etag))
+
+
+def not_modified_response(etag):
+    """Empty ``304 Not Modified`` response carrying the etag."""
+    return Response(status=304, headers={"ETag": quote_etag(str(etag))})
+
+
+def add_etag_header(etag):
+    """Set the ``ETag`` header on the response of the current request."""
+
+    @after_this_request
+    def _add_etag_header(response):
+        response.headers.setdefault("ETag", quote_etag(str(etag)))
+        return response
@@ -9,9 +9,36 @@
 
 """Service API."""
 
+from flask import has_request_context, request
+
 from ..errors import PermissionDeniedError
 
 
+def _request_permission_cache():
+    """Return the permission decisions memo of the current request.
+
+    The memo lives on the request object and is thus discarded when the
+    request ends. Outside of a request context there is no memo.
+    """
+    if not has_request_context():
+        return None
+    cache = getattr(request, "_permission_decisions", None)
+    if cache is None:
+        cache = request._permission_decisions = {}
+    return cache
+
+
+def clear_permission_cache():
+    """Clear the permission decisions memo of the current request.
+
+    The revision of a changed record (part of the memo key) is only updated
+    once the record is flushed, so the memo is cleared when records change.
+    """
+    cache = _request_permission_cache()
+    if cache:
+        cache.clear()
+
+
 class Service:
     """Service interface.
 
@@ -38,9 +65,56 @@ class Service:
         """Factory for a permission policy instance."""
         return self.config.permission_policy_cls(action_name, **kwargs)
 
+    def _permission_cache_key(self, identity, action_name, **kwargs):
+        """Compute the memo key of a permission check.
+
+        Only checks that depend on the identity, the action, the record (by
+        class, id and revision) and the file key can be memoized. ``None`` is
+        returned for any other check. The record class is part of the key, as
+        e.g. a draft and its record share the same id.
+        """
+        if set(kwargs) - {"record", "file_key"}:
+            return None
+
+        record = kwargs.get("record")
+        record_key = None
+        if record is not None:
+            record_id = getattr(record, "id", None)
+            if record_id is None:
+                return None
+            record_key = (
+                type(record),
+                str(record_id),
+                getattr(record, "revision_id", None),
+            )
+
+        return (
+            self.config.permission_policy_cls,
+            action_name,
+            getattr(identity, "id", None),
+            frozenset(getattr(identity, "provides", ())),
+            record_key,
+            kwargs.get("file_key"),
+        )
+
     def check_permission(self, identity, action_name, **kwargs):
-        """Check a permission against the identity."""
-        return self.permission_policy(action_name, **kwargs).allows(identity)
+        """Check a permission against the identity.
+
+        Decisions are memoized for the duration of the current request, so
+        that repeated checks of the same permission are not re-evaluated.
+        """
+        cache = _request_permission_cache()
+        key = None
+        if cache is not None:
+            key = self._permission_cache_key(identity, action_name, **kwargs)
+            if key is not None and key in cache:
+                return cache[key]
+
+        allowed = self.permission_policy(action_name, **kwargs).allows(identity)
+
+        if key is not None:
+            cache[key] = allowed
+        return allowed
 
     def require_permission(self, identity, action_name, **kwargs):
         """Require a specific permission from the permission policy.
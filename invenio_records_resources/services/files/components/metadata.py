@@ -35,13 +35,18 @@ class FileMetadataComponent(FileServiceComponent):
                     max_files=maxFiles, resulting_files_count=resulting_files_count
                 )
 
+        # Files are initialized in bulk, per transfer type
+        files_by_type = {}
         for file_data in validated_data:
             copy_fdata = deepcopy(file_data)
             file_type = copy_fdata.pop("storage_class", None)
+            files_by_type.setdefault(file_type, []).append(copy_fdata)
+
+        for file_type, files_data in files_by_type.items():
             transfer = Transfer.get_transfer(
                 file_type, service=self.service, uow=self.uow
             )
-            _ = transfer.init_file(record, copy_fdata)
+            _ = transfer.init_files(record, files_data)
 
     def update_file_metadata(self, identity, id, file_key, record, data):
         """Update file metadata handler."""
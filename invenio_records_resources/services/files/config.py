@@ -10,7 +10,7 @@
 """Record Service API."""
 
 from ..base import ServiceConfig
-from ..records.links import RecordLink
+from ..records.links import RecordLink, pagination_links
 from .components import (
     FileContentComponent,
     FileMetadataComponent,
@@ -41,10 +41,15 @@ class FileServiceConfig(ServiceConfig):
 
     max_files_count = 100
 
+    files_list_size = 100
+    files_list_max_size = 1000
+
     file_links_list = {
         "self": RecordLink("{+api}/records/{id}/files"),
     }
 
+    file_links_search = pagination_links("{+api}/records/{id}/files{?args*}")
+
     file_links_item = {
         "self": FileLink("{+api}/records/{id}/files/{+key}"),
         "content": FileLink("{+api}/records/{id}/files/{+key}/content"),
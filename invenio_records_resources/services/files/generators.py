@@ -19,6 +19,8 @@ from .transfer import TransferType
 class AnyUserIfFileIsLocal(Generator):
     """Allows any user."""
 
+    cacheable_query_filter = True
+
     def needs(self, **kwargs):
         """Enabling Needs."""
         record = kwargs["record"]
@@ -9,6 +9,7 @@
 
 """File service results."""
 
+from ...pagination import Pagination
 from ..base import ServiceListResult
 from ..records.results import RecordItem
 
@@ -65,7 +66,15 @@ class FileList(ServiceListResult):
     """List of file items result."""
 
     def __init__(
-        self, service, identity, results, record, links_tpl=None, links_item_tpl=None
+        self,
+        service,
+        identity,
+        results,
+        record,
+        links_tpl=None,
+        links_item_tpl=None,
+        params=None,
+        total=None,
     ):
         """Constructor.
 
@@ -73,6 +82,8 @@ class FileList(ServiceListResult):
         :params identity: an identity that performed the service request
         :params results: the search results
         :params links_config: a links store config
+        :params params: the pagination parameters, if the results are a page
+        :params total: the total number of files, if the results are a page
         """
         self._identity = identity
         self._record = record
@@ -80,6 +91,13 @@ class FileList(ServiceListResult):
         self._service = service
         self._links_tpl = links_tpl
         self._links_item_tpl = links_item_tpl
+        self._params = params
+        self._total = total
+
+    @property
+    def pagination(self):
+        """Create a pagination object."""
+        return Pagination(self._params["size"], self._params["page"], self._total)
 
     @property
     def entries(self):
@@ -105,7 +123,8 @@ class FileList(ServiceListResult):
             "enabled": record_files.enabled,
         }
         if self._links_tpl:
-            result["links"] = self._links_tpl.expand(self._identity, self._record)
+            obj = self._record if self._params is None else self.pagination
+            result["links"] = self._links_tpl.expand(self._identity, obj)
 
         if result["enabled"]:
             result.update(
@@ -115,4 +134,6 @@ class FileList(ServiceListResult):
                     "order": record_files.order,
                 }
             )
+            if self._params is not None:
+                result["total"] = self._total
         return result
@@ -70,19 +70,50 @@ class FileService(Service):
     #
     # High-level API
     #
-    def list_files(self, identity, id_):
-        """List the files of a record."""
+    def file_links_search_tpl(self, id_, params):
+        """Return a link template for paginated list results."""
+        return LinksTemplate(
+            self.config.file_links_search, context={"id": id_, "args": params}
+        )
+
+    def list_files(self, identity, id_, params=None):
+        """List the files of a record.
+
+        If any of the ``page``, ``size``, ``prefix`` or ``sort`` parameters is
+        given, only a page of the files (whose key starts with ``prefix``) is
+        listed.
+        """
         record = self._get_record(id_, identity, "read_files")
 
         self.run_components("list_files", id_, identity, record)
 
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if not params:
+            return self.file_result_list(
+                self,
+                identity,
+                results=record.files.values(),
+                record=record,
+                links_tpl=self.file_links_list_tpl(id_),
+                links_item_tpl=self.file_links_item_tpl(id_),
+            )
+
+        params.setdefault("page", 1)
+        params.setdefault("sort", "key")
+        params["size"] = min(
+            params.get("size", self.config.files_list_size),
+            self.config.files_list_max_size,
+        )
+        total, results = record.files.file_cls.list_by_record_page(record.id, **params)
         return self.file_result_list(
             self,
             identity,
-            results=record.files.values(),
+            results=results,
             record=record,
-            links_tpl=self.file_links_list_tpl(id_),
+            links_tpl=self.file_links_search_tpl(id_, params),
             links_item_tpl=self.file_links_item_tpl(id_),
+            params=params,
+            total=total,
         )
 
     @unit_of_work()
@@ -214,10 +245,7 @@ class FileService(Service):
         """Delete all the files of the record."""
         record = self._get_record(id_, identity, "delete_files")
 
-        # We have to separate the gathering of the keys from their deletion
-        # because of how record.files is implemented.
-        file_keys = [fk for fk in record.files]
-        results = [record.files.delete(file_key) for file_key in file_keys]
+        results = record.files.delete_all()
 
         self.run_components("delete_all_files", identity, id_, record, results, uow=uow)
 
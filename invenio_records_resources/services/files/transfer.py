@@ -67,6 +67,10 @@ class BaseTransfer(ABC):
         """Initialize a file."""
         raise NotImplementedError()
 
+    def init_files(self, record, files_data):
+        """Initialize many files."""
+        return [self.init_file(record, file_data) for file_data in files_data]
+
     def set_file_content(self, record, file, file_key, stream, content_length):
         """Set file content."""
         bucket = record.files.bucket
@@ -115,16 +119,27 @@ class LocalTransfer(BaseTransfer):
         """Constructor."""
         super().__init__(TransferType.LOCAL, **kwargs)
 
-    def init_file(self, record, file_data):
-        """Initialize a file."""
+    def _create_args(self, file_data):
+        """Get the key, data and object of a file to create."""
         uri = file_data.pop("uri", None)
         if uri:
             raise Exception("Cannot set URI for local files.")
 
-        file = record.files.create(key=file_data.pop("key"), data=file_data)
+        return file_data.pop("key"), file_data, None
+
+    def init_file(self, record, file_data):
+        """Initialize a file."""
+        key, data, obj = self._create_args(file_data)
+        file = record.files.create(key=key, data=data, obj=obj)
 
         return file
 
+    def init_files(self, record, files_data):
+        """Initialize many files (in bulk)."""
+        return record.files.create_many(
+            [self._create_args(file_data) for file_data in files_data]
+        )
+
     def set_file_content(self, record, file, file_key, stream, content_length):
         """Set file content."""
         if file:
@@ -140,8 +155,8 @@ class FetchTransfer(BaseTransfer):
         """Constructor."""
         super().__init__(TransferType.FETCH, **kwargs)
 
-    def init_file(self, record, file_data):
-        """Initialize a file."""
+    def _create_args(self, file_data):
+        """Get the key, data and object of a file to create."""
         uri = file_data.pop("uri", None)
         if not uri:
             raise Exception("URI is required for fetch files.")
@@ -154,14 +169,10 @@ class FetchTransfer(BaseTransfer):
                 "size": file_data.pop("size", None),
             }
         }
+        return file_data.pop("key"), file_data, obj_kwargs
 
-        file_key = file_data.pop("key")
-        file = record.files.create(
-            key=file_key,
-            data=file_data,
-            obj=obj_kwargs,
-        )
-
+    def _register_fetch(self, record, file_key):
+        """Register the task fetching the file."""
         self.uow.register(
             TaskOp(
                 fetch_file,
@@ -170,8 +181,24 @@ class FetchTransfer(BaseTransfer):
                 file_key=file_key,
             )
         )
+
+    def init_file(self, record, file_data):
+        """Initialize a file."""
+        file_key, data, obj = self._create_args(file_data)
+        file = record.files.create(key=file_key, data=data, obj=obj)
+
+        self._register_fetch(record, file_key)
         return file
 
+    def init_files(self, record, files_data):
+        """Initialize many files (in bulk)."""
+        files = record.files.create_many(
+            [self._create_args(file_data) for file_data in files_data]
+        )
+        for file in files:
+            self._register_fetch(record, file.key)
+        return files
+
 
 class Transfer:
     """Transfer type."""
@@ -68,9 +68,13 @@ class RecordServiceConfig(ServiceConfig):
     index_dumper = None  # use default dumper defined on record class
     # inverse relation mapping, stores which fields relate to which record type
     relations = {}
+    # patch the dereferenced relations in the index instead of reindexing
+    relations_partial_update = False
 
     # Search configuration
     search = SearchOptions
+    # cache search responses for this many seconds (disabled if None)
+    search_cache_ttl = None
 
     # Service schema
     schema = None  # Needs to be defined on concrete record service config
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Search permission filters."""
+
+from copy import deepcopy
+
+from flask import current_app
+from invenio_records_permissions.api import permission_filter
+from invenio_records_permissions.generators import (
+    AnyUser,
+    AuthenticatedUser,
+    Disable,
+    SystemProcess,
+)
+
+CACHEABLE_GENERATORS = (AnyUser, AuthenticatedUser, Disable, SystemProcess)
+"""Generators whose query filter only depends on the identity's needs.
+
+Other generators can declare it by setting ``cacheable_query_filter = True``.
+"""
+
+
+def current_permission_filter_cache():
+    """Get the permission filter cache of the current application (if any)."""
+    ext = current_app.extensions.get("invenio-records-resources")
+    return getattr(ext, "permission_filter_cache", None)
+
+
+def is_cacheable_generator(generator):
+    """Check if the query filter of a generator can be cached."""
+    return getattr(
+        generator, "cacheable_query_filter", type(generator) in CACHEABLE_GENERATORS
+    )
+
+
+def permission_filter_cache_key(permission):
+    """Compute the cache key of the search filter of a permission.
+
+    Returns ``None`` if the filter cannot be cached, i.e. if the policy was
+    given other arguments than the identity or if any of its generators is not
+    cacheable.
+    """
+    over = getattr(permission, "over", None)
+    if over is None or set(over) - {"identity"}:
+        return None
+    generators = getattr(permission, "generators", None)
+    if generators is None or not all(is_cacheable_generator(g) for g in generators):
+        return None
+
+    identity = over.get("identity")
+    return (
+        type(permission),
+        permission.action,
+        getattr(identity, "id", None),
+        frozenset(getattr(identity, "provides", ())),
+    )
+
+
+def cached_permission_filter(permission):
+    """Search filter of a permission, reusing a cached one when possible."""
+    permission_filter_cache = current_permission_filter_cache()
+    key = permission_filter_cache_key(permission)
+    if permission_filter_cache is None or key is None:
+        return permission_filter(permission)
+
+    query_filter = permission_filter_cache.get(key)
+    if query_filter is None:
+        query_filter = permission_filter(permission)
+        permission_filter_cache.set(key, query_filter)
+    # Queries are mutable, so never hand out the cached instance
+    return deepcopy(query_filter)
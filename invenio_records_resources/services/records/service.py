@@ -10,28 +10,52 @@
 
 """Record Service API."""
 
+from copy import deepcopy
+
 from flask import current_app
 from invenio_db import db
-from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_records_permissions.api import permission_filter
+from invenio_pidstore.errors import PIDDeletedError, PIDDoesNotExistError
+from invenio_records.dictutils import dict_lookup, dict_set
+from invenio_records.systemfields.relations import InvalidRelationValue, ListRelation
 from invenio_search import current_search_client
 from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
 from kombu import Queue
 from marshmallow import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.local import LocalProxy
 
+from invenio_records_resources.proxies import current_search_cache
 from invenio_records_resources.services.errors import (
     PermissionDeniedError,
     RecordPermissionDeniedError,
 )
 
+from ...records.systemfields.relations import (
+    PIDNestedListRelation,
+    PIDRelation,
+    dereference_many,
+)
 from ..base import LinksTemplate, Service
 from ..errors import RevisionIdMismatchError
+from ..search_cache import invalidate_search_cache
 from ..uow import RecordBulkCommitOp, RecordCommitOp, RecordDeleteOp, unit_of_work
+from .permissions import cached_permission_filter
 from .schema import ServiceSchemaWrapper
 
 
+def _patch_relation(data, keys, values, id_key="id"):
+    """Replace the dereferenced objects of a relation in a document."""
+    node = data
+    for key in keys:
+        node = node.get(key) if isinstance(node, dict) else None
+    for item in node if isinstance(node, list) else [node]:
+        if isinstance(item, dict) and item.get(id_key) in values:
+            value = deepcopy(values[item[id_key]])
+            item.clear()
+            item.update(value)
+
+
 class RecordIndexerMixin:
     """Mixin class to define record indexer.
 
@@ -137,7 +161,7 @@ class RecordService(Service, RecordIndexerMixin):
         else:
             permission = None
 
-        default_filter = permission_filter(permission)
+        default_filter = cached_permission_filter(permission)
         if extra_filter is not None:
             default_filter = default_filter & extra_filter
 
@@ -234,6 +258,14 @@ class RecordService(Service, RecordIndexerMixin):
                 search = getattr(component, action)(identity, search, params)
         return search
 
+    def _execute_search(self, search):
+        """Execute a search, using the search responses cache if enabled."""
+        ttl = getattr(self.config, "search_cache_ttl", None)
+        search_cache = current_search_cache if ttl else None
+        if search_cache is None:
+            return search.execute()
+        return search_cache.execute(search, ttl)
+
     #
     # High-level API
     #
@@ -246,7 +278,7 @@ class RecordService(Service, RecordIndexerMixin):
         # Prepare and execute the search
         params = params or {}
         search = self._search("search", identity, params, search_preference, **kwargs)
-        search_result = search.execute()
+        search_result = self._execute_search(search)
 
         return self.result_list(
             self,
@@ -317,6 +349,7 @@ class RecordService(Service, RecordIndexerMixin):
         iterable_ids = (res.meta.id for res in search_result)
 
         self.indexer.bulk_index(iterable_ids)
+        invalidate_search_cache(self.record_cls)
         return True
 
     @unit_of_work()
@@ -408,6 +441,22 @@ class RecordService(Service, RecordIndexerMixin):
         except (PIDDoesNotExistError, PermissionDeniedError):
             return False
 
+    def exists_many(self, identity, ids):
+        """Check which records exist and can be read by the user.
+
+        The records are resolved in a single query (see
+        ``PIDFieldContext.resolve_many()``) for checking the permissions.
+        Unknown, unregistered or deleted records do not exist.
+
+        :returns: A dict of booleans by id.
+        """
+        records = self.record_cls.pid.resolve_many(ids)
+        return {
+            id_: id_ in records
+            and self.check_permission(identity, "read", record=records[id_])
+            for id_ in ids
+        }
+
     def _read_many(
         self,
         identity,
@@ -534,6 +583,7 @@ class RecordService(Service, RecordIndexerMixin):
         )
 
         self.indexer.bulk_index((rec.id for rec in records))
+        invalidate_search_cache(self.record_cls)
 
         return True
 
@@ -541,7 +591,7 @@ class RecordService(Service, RecordIndexerMixin):
     # notification handlers
     #
     def on_relation_update(
-        self, identity, record_type, records_info, notif_time, limit=100
+        self, identity, record_type, records_info, notif_time, limit=None
     ):
         """Handles the update of a related field record.
 
@@ -550,38 +600,188 @@ class RecordService(Service, RecordIndexerMixin):
         :param records_info: a list of tuples containing (recid, uuid, revision_id)
                              for each record to reindex.
         :param notif_time: reindex records index before this time.
-        :param limit: reindex in chunks of these records. The limit must be lower than
-                      the search engine maxClauseCount setting.
+        :param limit: reindex in chunks of these records. Defaults to the most
+                      records whose terms fit in one query (see
+                      ``RECORDS_RESOURCES_RELATIONS_MAX_TERMS_COUNT``).
         :returns: True.
         """
         fieldpaths = self.config.relations.get(record_type, [])
-        clauses = []
-        for field in fieldpaths:
-            for record in records_info:
-                recid, uuid, revision_id = record
-                clauses.append(
-                    dsl.Q(
-                        "bool",
-                        must=[dsl.Q("term", **{f"{field}.id": recid})],
-                        must_not=[
-                            dsl.Q("term", **{f"{field}.@v": f"{uuid}::{revision_id}"})
-                        ],
-                    )
-                )
 
-        filter = [dsl.Q("range", indexed_at={"lte": notif_time})]
-        # split the list in chunks of `limit`, the last chunk will have the remaining
-        chunked_clauses = [
-            clauses[i : i + limit] for i in range(0, len(clauses), limit)
-        ]
-        for chunked_clause in chunked_clauses:
-            search_query = dsl.Q(
-                "bool", minimum_should_match=1, should=chunked_clause, filter=filter
-            )
+        if self.config.relations_partial_update:
+            patches = self._relation_patches(fieldpaths, records_info)
+            for search_query in self._relation_update_queries(
+                list(patches), records_info, notif_time, limit
+            ):
+                self.patch_relations(identity, patches, search_query)
+            fieldpaths = [f for f in fieldpaths if f not in patches]
 
+        for search_query in self._relation_update_queries(
+            fieldpaths, records_info, notif_time, limit
+        ):
             self.reindex(identity, search_query=search_query)
         return True
 
+    def _relation_results(self):
+        """Get the relation results of an empty record, by field path."""
+        relations = getattr(self.record_cls({}), "relations", None)
+        if relations is None:
+            return {}
+        results = (getattr(relations, name) for name in relations)
+        return {result.field.key: result for result in results}
+
+    def _relation_update_queries(self, fieldpaths, records_info, notif_time, limit):
+        """Queries matching the records with outdated related records.
+
+        The updated records are split in chunks of ``limit``, and each query
+        has one ``terms`` clause per field. A relation to a single record is
+        outdated if it points to any of the updated records with another
+        version. Lists of relations can mix up-to-date and outdated related
+        records, hence are only matched on the IDs of the updated records.
+
+        :param limit: the maximum number of updated records per query. Defaults
+            to the terms budget shared by the ID and version terms of all the
+            fields.
+        """
+        if not fieldpaths:
+            return
+        if limit is None:
+            max_terms = current_app.config[
+                "RECORDS_RESOURCES_RELATIONS_MAX_TERMS_COUNT"
+            ]
+            limit = max(max_terms // (2 * len(fieldpaths)), 1)
+
+        # Deduplicate the updated records, keeping their latest revision
+        versions = {}
+        for recid, uuid, revision_id in sorted(records_info, key=lambda r: r[2]):
+            versions[recid] = f"{uuid}::{revision_id}"
+
+        relations = self._relation_results()
+        filter = [dsl.Q("range", indexed_at={"lte": notif_time})]
+        recids = list(versions)
+        for i in range(0, len(recids), limit):
+            chunk = recids[i : i + limit]
+            clauses = []
+            for field in fieldpaths:
+                must = [dsl.Q("terms", **{f"{field}.id": chunk})]
+                relation = getattr(relations.get(field), "field", None)
+                if isinstance(relation, PIDRelation) and not isinstance(
+                    relation, ListRelation
+                ):
+                    chunk_versions = [versions[recid] for recid in chunk]
+                    must_not = [dsl.Q("terms", **{f"{field}.@v": chunk_versions})]
+                    clauses.append(dsl.Q("bool", must=must, must_not=must_not))
+                else:
+                    clauses.append(dsl.Q("bool", must=must))
+            yield dsl.Q("bool", minimum_should_match=1, should=clauses, filter=filter)
+
+    def _relation_patches(self, fieldpaths, records_info):
+        """Dereference the updated related records for patching the index.
+
+        Only the relations which are stored as single objects or lists of
+        objects can be patched, the other ones must be reindexed. The related
+        records are resolved with one query per relation, by dereferencing
+        stub records which only hold the relation.
+
+        :returns: A dict of ``{fieldpath: {id: dereferenced object}}``.
+        """
+        relations = getattr(self.record_cls({}), "relations", None)
+        recids = sorted({recid for recid, _, _ in records_info})
+        patches = {}
+        for name in relations or []:
+            relation = getattr(relations, name).field
+            fieldpath = relation.key
+            if (
+                fieldpath not in fieldpaths
+                or not isinstance(relation, PIDRelation)
+                or isinstance(relation, PIDNestedListRelation)
+                or getattr(relation, "relation_field", None)
+            ):
+                continue
+            is_list = isinstance(relation, ListRelation)
+            stubs = []
+            for recid in recids:
+                stub = self.record_cls({})
+                value = {relation._value_key_suffix: recid}
+                dict_set(stub, fieldpath, [value] if is_list else value)
+                stubs.append(stub)
+            try:
+                dereference_many(stubs, fields=[name])
+            except (PIDDoesNotExistError, PIDDeletedError, InvalidRelationValue):
+                # e.g. the related record can no longer be resolved
+                current_app.logger.info(
+                    "Relation %s cannot be patched, reindexing instead.", fieldpath
+                )
+                continue
+            patches[fieldpath] = {}
+            for recid, stub in zip(recids, stubs):
+                value = dict_lookup(stub, fieldpath)
+                patches[fieldpath][recid] = value[0] if is_list else value
+        return patches
+
+    def patch_relations(self, identity, patches, search_query):
+        """Patch the dereferenced relations of the matching indexed records.
+
+        The search documents are updated in place, without loading the records
+        from the database. Each document is written back with its current
+        version (``external_gte``), so that it never overwrites a more recent
+        indexing of the record.
+
+        Documents which fail to be patched are reindexed instead, except for
+        version conflicts since a more recent indexing already covers them.
+
+        :param patches: A dict of ``{fieldpath: {id: dereferenced object}}``.
+        :param search_query: The query matching the documents to patch.
+        """
+        self.require_permission(identity, "search")
+
+        # The related objects are matched on the value key of their relation
+        relations = self._relation_results()
+        id_keys = {}
+        for fieldpath in patches:
+            relation = getattr(relations.get(fieldpath), "field", None)
+            id_keys[fieldpath] = getattr(relation, "_value_key_suffix", "id")
+
+        search = (
+            self.search_request(identity, {}, self.record_cls, self.config.search)
+            .query(search_query)
+            .params(version=True)
+        )
+
+        def _actions():
+            for hit in search.scan():
+                source = hit.to_dict()
+                for fieldpath, values in patches.items():
+                    _patch_relation(
+                        source, fieldpath.split("."), values, id_keys[fieldpath]
+                    )
+                yield {
+                    "_op_type": "index",
+                    "_index": hit.meta.index,
+                    "_id": hit.meta.id,
+                    "_version": hit.meta.version,
+                    "_version_type": "external_gte",
+                    "_source": source,
+                }
+
+        _, errors = search_engine.helpers.bulk(
+            current_search_client, _actions(), raise_on_error=False
+        )
+        failed = []
+        for error in errors:
+            item = next(iter(error.values()))
+            if item.get("status") == 409:
+                continue
+            current_app.logger.warning(
+                "Failed to patch the relations of %s: %s",
+                item.get("_id"),
+                item.get("error"),
+            )
+            failed.append(item["_id"])
+        if failed:
+            self.indexer.bulk_index(failed)
+        invalidate_search_cache(self.record_cls)
+        return True
+
     @unit_of_work()
     def create_or_update_many(self, identity, data, uow=None):
         """Create or update a list of records.
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Search responses cache.
+
+Registered services opt in by setting ``search_cache_ttl`` on their
+configuration. The raw search engine responses are then cached, keyed by the compiled search
+request (query, permission filters, aggregations, sort and pagination) and a
+generation counter of the searched index.
+
+The generation counter of an index is bumped whenever a record of that index
+is committed, deleted or reindexed (see ``RecordCommitOp``, ``RecordDeleteOp``
+and ``RecordService.reindex``), which invalidates all cached responses of the
+index before their TTL expires. Bulk indexing is asynchronous though, so
+responses cached before the indexing queue is processed are only refreshed
+once their TTL expires.
+"""
+
+import hashlib
+import json
+from itertools import count
+from uuid import uuid4
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_search.utils import prefix_index
+
+from ..cache import LRUCache
+
+
+class SearchCache:
+    """Interface of a search responses cache backend."""
+
+    def get(self, key):
+        """Get a cached raw response (``None`` if not cached)."""
+        raise NotImplementedError()
+
+    def set(self, key, value, ttl):
+        """Cache a raw response for ``ttl`` seconds."""
+        raise NotImplementedError()
+
+    def get_generation(self, index):
+        """Get the generation counter of an index."""
+        raise NotImplementedError()
+
+    def bump_generation(self, index):
+        """Increment the generation counter of an index."""
+        raise NotImplementedError()
+
+    def make_key(self, search):
+        """Compute the cache key of a search request.
+
+        The ``preference`` parameter is left out, since it is only used for
+        keeping the results of one client consistent.
+        """
+        indices = sorted(search._index or [])
+        params = {k: v for k, v in search._params.items() if k != "preference"}
+        payload = json.dumps(
+            {
+                "index": indices,
+                "generations": [self.get_generation(i) for i in indices],
+                "params": params,
+                "body": search.to_dict(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return "search:" + hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def execute(self, search, ttl):
+        """Execute a search, serving the response from the cache if possible."""
+        key = self.make_key(search)
+        cached = self.get(key)
+        if cached is not None:
+            return search._response_class(search, json.loads(cached))
+
+        response = search.execute()
+        self.set(key, json.dumps(response.to_dict()), ttl)
+        return response
+
+
+class SharedSearchCache(SearchCache):
+    """Search responses cache shared by all processes (uses Invenio-Cache)."""
+
+    def get(self, key):
+        """Get a cached raw response."""
+        return current_cache.get(key)
+
+    def set(self, key, value, ttl):
+        """Cache a raw response."""
+        current_cache.set(key, value, timeout=ttl)
+
+    def get_generation(self, index):
+        """Get the generation counter of an index."""
+        return current_cache.get(f"search-generation:{index}") or 0
+
+    def bump_generation(self, index):
+        """Replace the generation counter of an index.
+
+        A random value is used instead of an increment, so that concurrent
+        bumps can never end up on the same generation.
+        """
+        current_cache.set(f"search-generation:{index}", uuid4().hex, timeout=0)
+
+
+class InMemorySearchCache(SearchCache):
+    """Per-process search responses cache (e.g. for tests)."""
+
+    def __init__(self, maxsize=1024):
+        """Constructor."""
+        self._responses = LRUCache(maxsize=maxsize)
+        self._generations = {}
+        self._counter = count(1)
+
+    def get(self, key):
+        """Get a cached raw response."""
+        return self._responses.get(key)
+
+    def set(self, key, value, ttl):
+        """Cache a raw response."""
+        self._responses.set(key, value, ttl=ttl)
+
+    def get_generation(self, index):
+        """Get the generation counter of an index."""
+        return self._generations.get(index, 0)
+
+    def bump_generation(self, index):
+        """Increment the generation counter of an index."""
+        # Taken from a global counter to be safe from concurrent bumps.
+        self._generations[index] = next(self._counter)
+
+
+def cached_search_aliases():
+    """Get the search aliases of the registered services caching responses."""
+    ext = current_app.extensions.get("invenio-records-resources")
+    registry = getattr(ext, "registry", None)
+    services = registry._services.values() if registry is not None else []
+    return {
+        service.record_cls.index.search_alias
+        for service in services
+        if getattr(getattr(service, "config", None), "search_cache_ttl", None)
+    }
+
+
+def invalidate_search_cache(*records):
+    """Invalidate the cached search responses of the indices of records.
+
+    Only the indices searched by registered services with ``search_cache_ttl``
+    are invalidated, the other ones are never cached.
+
+    :param records: Records or record classes.
+    """
+    ext = current_app.extensions.get("invenio-records-resources")
+    search_cache = getattr(ext, "search_cache", None)
+    if search_cache is None:
+        return
+    search_aliases = {
+        getattr(getattr(record, "index", None), "search_alias", None)
+        for record in records
+    }
+    for search_alias in search_aliases & cached_search_aliases():
+        search_cache.bump_generation(prefix_index(search_alias))
@@ -104,6 +104,7 @@ class and implementing the desired methods:
 """
 
 from celery import current_app
+from flask import current_app as current_flask_app
 
 # backwards compatible imports
 from invenio_db.uow import (
@@ -114,7 +115,11 @@ from invenio_db.uow import (
     unit_of_work,
 )
 
+from ..notifications import merge_records_info, publish_change_notification
+from ..records.cache import invalidate_read_cache, invalidate_relation_cache
 from ..tasks import send_change_notifications
+from .base.service import clear_permission_cache
+from .search_cache import invalidate_search_cache
 
 __all__ = ["ModelCommitOp", "ModelDeleteOp", "Operation", "UnitOfWork", "unit_of_work"]
 
@@ -134,12 +139,15 @@ class RecordCommitOp(Operation):
     def on_register(self, uow):
         """Commit record (will flush to the database)."""
         self._record.commit()
+        clear_permission_cache()
 
     def on_commit(self, uow):
         """Run the operation."""
+        invalidate_read_cache(self._record)
         if self._indexer is not None:
             arguments = {"refresh": True} if self._index_refresh else {}
             self._indexer.index(self._record, arguments=arguments)
+            invalidate_search_cache(self._record)
 
 
 class RecordBulkCommitOp(Operation):
@@ -155,13 +163,21 @@ class RecordBulkCommitOp(Operation):
         """Save objects to the session."""
         for record in self._records:
             record.commit()
+        clear_permission_cache()
 
     def on_commit(self, uow):
         """Run the operation."""
+        for record in self._records:
+            invalidate_read_cache(record)
         if self._indexer is not None:
             record_ids = [record.id for record in self._records]
             self._indexer.bulk_index(record_ids)
 
+    def on_post_commit(self, uow):
+        """Invalidate the cached search responses of the indexed records."""
+        if self._indexer is not None:
+            invalidate_search_cache(*self._records)
+
 
 class RecordIndexOp(RecordCommitOp):
     """Record indexing operation."""
@@ -202,11 +218,14 @@ class RecordDeleteOp(Operation):
     def on_register(self, uow):
         """Soft/hard delete record."""
         self._record.delete(force=self._force)
+        clear_permission_cache()
 
     def on_commit(self, uow):
         """Delete from index."""
+        invalidate_read_cache(self._record)
         if self._indexer is not None:
             self._indexer.delete(self._record, refresh=self._index_refresh)
+            invalidate_search_cache(self._record)
 
 
 class RecordIndexDeleteOp(RecordDeleteOp):
@@ -271,16 +290,42 @@ class TaskRevokeOp(Operation):
 
 
 class ChangeNotificationOp(Operation):
-    """A change notification operation."""
+    """A change notification operation.
+
+    Notifications registered in the same unit of work for the same record type
+    are merged, and sent by a single task. If
+    ``RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_DEBOUNCE`` is enabled, they are
+    published to the outbox instead (see
+    :mod:`invenio_records_resources.notifications`).
+    """
 
     def __init__(self, record_type, records):
         """Constructor."""
         self._record_type = record_type
-        self._records = records
+        self._records = list(records)
+        self._merged = False
+
+    def on_register(self, uow):
+        """Merge with a notification previously registered for the type."""
+        for op in uow._operations:
+            if (
+                isinstance(op, ChangeNotificationOp)
+                and not op._merged
+                and op._record_type == self._record_type
+            ):
+                op._records.extend(self._records)
+                self._merged = True
+                break
 
     def on_post_commit(self, uow):
         """Send the notification (run celery task)."""
-        send_change_notifications.delay(
-            self._record_type,
-            [(r.pid.pid_value, str(r.id), r.revision_id) for r in self._records],
+        if self._merged:
+            return
+        records_info = merge_records_info(
+            [(r.pid.pid_value, str(r.id), r.revision_id) for r in self._records]
         )
+        invalidate_relation_cache(records_info)
+        if current_flask_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_DEBOUNCE"]:
+            publish_change_notification(self._record_type, records_info)
+        else:
+            send_change_notifications.delay(self._record_type, records_info)
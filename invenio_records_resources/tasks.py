@@ -8,15 +8,25 @@
 
 """Celery tasks for async processing."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import arrow
 from celery import current_app as current_celery_app
-from celery import shared_task
+from celery import group, shared_task
 from flask import current_app
 from invenio_access.permissions import system_identity
+from invenio_db import db
 from invenio_indexer.proxies import current_indexer_registry
 from invenio_indexer.tasks import process_bulk_queue
 
-from .proxies import current_notifications_registry, current_service_registry
+from .notifications import pending_change_notifications
+from .proxies import (
+    current_indexer_autoscaler,
+    current_notifications_registry,
+    current_service_registry,
+)
+from .records.cache import invalidate_relation_cache
 
 
 @shared_task(ignore_result=True)
@@ -29,26 +39,165 @@ def extract_file_metadata(service_id, record_id, file_key):
         current_app.logger.exception("Failed to extract file metadata.")
 
 
+def _run_notification_handler(record_type, handler, records_info, task_start):
+    """Run a change notification handler, logging how long it took."""
+    start = time.monotonic()
+    handler(system_identity, record_type, records_info, task_start)
+    current_app.logger.info(
+        "Change notification handler %s took %.3fs for %s %s records.",
+        getattr(handler, "__qualname__", repr(handler)),
+        time.monotonic() - start,
+        len(records_info),
+        record_type,
+    )
+
+
+def _run_notification_handler_eagerly(record_type, handler, records_info, task_start):
+    """Run a change notification handler with local retries.
+
+    The session is rolled back after each failed attempt, and the error of the
+    last attempt is raised.
+    """
+    retries = current_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_MAX_RETRIES"]
+    for attempt in range(retries + 1):
+        try:
+            return _run_notification_handler(
+                record_type, handler, records_info, task_start
+            )
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception("Change notification handler failed.")
+            if attempt == retries:
+                raise
+
+
+def _run_in_app_context(app, func, *args):
+    """Run a function in a new application context (e.g. in a thread)."""
+    with app.app_context():
+        return func(*args)
+
+
+@shared_task(bind=True, ignore_result=True, default_retry_delay=10)
+def run_change_notification_handler(
+    self, record_type, handler_index, records_info, task_start
+):
+    """Execute a single handler set up for a record_type update.
+
+    Handlers are identified by their index in the notifications registry,
+    which is the same in every process as it is built from the configuration.
+    """
+    handler = current_notifications_registry.get(record_type)[handler_index]
+    try:
+        _run_notification_handler(record_type, handler, records_info, task_start)
+    except Exception as exc:
+        current_app.logger.exception("Change notification handler failed.")
+        raise self.retry(
+            exc=exc,
+            max_retries=current_app.config[
+                "RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_MAX_RETRIES"
+            ],
+        )
+
+
 @shared_task(ignore_result=True)
 def send_change_notifications(record_type, records_info):
-    """Execute the handlers set up for a record_type update."""
+    """Execute the handlers set up for a record_type update.
+
+    The handlers run in parallel (as a group of tasks, or in a thread pool when
+    tasks are executed eagerly), each one on chunks of the records.
+    """
     task_start = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+    invalidate_relation_cache(records_info)
 
     handlers = current_notifications_registry.get(record_type)
-    for notif_handler in handlers:
-        notif_handler(system_identity, record_type, records_info, task_start)
+    if not handlers or not records_info:
+        return
+
+    size = current_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_CHUNK_SIZE"]
+    chunks = [records_info[i : i + size] for i in range(0, len(records_info), size)]
+
+    if not current_celery_app.conf.task_always_eager:
+        group(
+            run_change_notification_handler.si(record_type, idx, chunk, task_start)
+            for idx in range(len(handlers))
+            for chunk in chunks
+        ).apply_async()
+        return
+
+    calls = [(handler, chunk) for handler in handlers for chunk in chunks]
+    workers = current_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_EAGER_WORKERS"]
+    if workers <= 1:
+        # run all the handlers before raising, so that a failing handler does
+        # not affect the other ones
+        errors = []
+        for handler, chunk in calls:
+            try:
+                _run_notification_handler_eagerly(
+                    record_type, handler, chunk, task_start
+                )
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            raise errors[0]
+        return
+
+    app = current_app._get_current_object()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _run_in_app_context,
+                app,
+                _run_notification_handler_eagerly,
+                record_type,
+                handler,
+                chunk,
+                task_start,
+            )
+            for handler, chunk in calls
+        ]
+    for future in futures:
+        future.result()
+
+
+@shared_task(ignore_result=True)
+def flush_change_notifications(max_messages=None):
+    """Send the debounced change notifications, one task per record type."""
+    with pending_change_notifications(max_messages=max_messages) as notifications:
+        for record_type, records_info in notifications.items():
+            send_change_notifications.delay(record_type, records_info)
 
 
 @shared_task(ignore_result=True)
 def manage_indexer_queues():
-    """Peeks into queues and spawns bulk indexers."""
+    """Peeks into queues and spawns bulk indexers.
+
+    The number of bulk indexers to spawn and the size of their bulk requests
+    are decided by the autoscaler, from the depth of the queues.
+    """
     channel = current_celery_app.connection().channel()
     indexers = current_indexer_registry.all()
+    max_consumers = current_app.config["INDEXER_MAX_BULK_CONSUMERS"]
 
     for name, indexer in indexers.items():
         queue = indexer.mq_queue.bind(channel)
         _, num_messages, num_consumers = queue.queue_declare()
-        max_consumers = current_app.config["INDEXER_MAX_BULK_CONSUMERS"]
+        decision = current_indexer_autoscaler.scale(
+            name, num_messages, num_consumers, max_consumers
+        )
+        if num_messages > 0:
+            current_app.logger.info(
+                "Indexer %s: %s messages, %s consumers (%s started), "
+                "bulk size %s, ETA %s.",
+                name,
+                decision.backlog,
+                decision.consumers,
+                decision.start,
+                decision.chunk_size,
+                "unknown" if decision.eta is None else f"{decision.eta:.0f}s",
+            )
 
-        if num_messages > 0 and num_consumers < max_consumers:
-            process_bulk_queue.delay(indexer_name=name)
+        for _ in range(decision.start):
+            process_bulk_queue.delay(
+                indexer_name=name,
+                search_bulk_kwargs={"chunk_size": decision.chunk_size},
+            )
@@ -13,10 +13,13 @@ See https://pytest-invenio.readthedocs.io/ for documentation on which test
 fixtures are available.
 """
 
+from contextlib import contextmanager
+
 import pytest
 from flask_principal import Identity, Need, UserNeed
 from invenio_app.factory import create_api as _create_api
 from mock_module.config import MockFileServiceConfig, ServiceConfig
+from sqlalchemy import event
 
 from invenio_records_resources.services import FileService, RecordService
 
@@ -48,6 +51,10 @@ def app_config(app_config):
         "invenio_jsonschemas.proxies.current_refresolver_store"
     )
 
+    app_config["RECORDS_RESOURCES_SEARCH_CACHE"] = (
+        "invenio_records_resources.services.search_cache:InMemorySearchCache"
+    )
+
     return app_config
 
 
@@ -100,3 +107,23 @@ def identity_simple():
     i.provides.add(UserNeed(1))
     i.provides.add(Need(method="system_role", value="any_user"))
     return i
+
+
+@pytest.fixture()
+def count_queries(db):
+    """Count the queries executed in a block."""
+
+    @contextmanager
+    def _count_queries():
+        queries = []
+
+        def _count(*args, **kwargs):
+            queries.append(args)
+
+        event.listen(db.engine, "before_cursor_execute", _count)
+        try:
+            yield queries
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _count)
+
+    return _count_queries
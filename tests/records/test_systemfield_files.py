@@ -9,14 +9,21 @@
 
 """Files field tests."""
 
+import mimetypes
+import time
 from io import BytesIO
 
+import pytest
+from invenio_files_rest.errors import InvalidKeyError
 from invenio_files_rest.models import Bucket, FileInstance, ObjectVersion
+from invenio_records.extensions import RecordExtension
 from invenio_records.systemfields import ConstantField, ModelField
+from jsonschema.exceptions import ValidationError
 from mock_module import models
 from mock_module.api import FileRecord
 from mock_module.api import Record as RecordBase
 
+from invenio_records_resources.records import dumpers
 from invenio_records_resources.records.dumpers import PartialFileDumper
 from invenio_records_resources.records.systemfields.files import FilesField
 
@@ -458,3 +465,347 @@ def test_record_files_access_implicit_not_set(base_app, db, location):
     data = record.dumps()
     assert data["files"]["entries"][0].get("access") is None
     assert record.files["f1.txt"].model.json.get("access") is None
+
+
+def test_record_files_eager_loading(base_app, db, location, count_queries):
+    """Test that file entries are loaded with their files in one query."""
+    record = Record2.create({})
+    for i in range(10):
+        record.files[f"f{i}.txt"] = BytesIO(b"testfile")
+    record.commit()
+    db.session.commit()
+    record_id = record.id
+    db.session.expunge_all()
+
+    files = Record2.get_record(record_id).files
+    with count_queries() as queries:
+        assert files.total_bytes == 80
+        assert files.mimetypes == ["text/plain"]
+        assert files.exts == ["txt"]
+        assert all(rf.file.checksum for rf in files.values())
+    assert len(queries) == 1
+
+    with count_queries() as queries:
+        rf = FileRecord.get_by_key(record_id, "f1.txt")
+        assert rf.file.size == 8
+    assert len(queries) == 1
+
+
+def test_record_files_aggregates(base_app, db, location, mocker):
+    """Test that the files aggregates are updated incrementally."""
+    record = Record2.create({})
+    record.files["f1.txt"] = BytesIO(b"testfile")
+    record.files["f2.txt"] = BytesIO(b"test")
+    assert record.files.total_bytes == 12
+    assert record.files.mimetypes == ["text/plain"]
+    assert record.files.exts == ["txt"]
+
+    # Unchanged files are not inspected again
+    guess = mocker.spy(mimetypes, "guess_extension")
+    record.commit()
+    assert record.files.exts == ["txt"]
+    assert guess.call_count == 0
+
+    # Only the changed files are
+    record.files["f3.png"] = BytesIO(b"png")
+    record.files["f1.txt"] = BytesIO(b"test")
+    assert guess.call_count == 2
+    assert record.files.total_bytes == 11
+    assert sorted(record.files.mimetypes) == ["image/png", "text/plain"]
+    assert sorted(record.files.exts) == ["png", "txt"]
+
+    record.files.delete("f3.png")
+    record.files.delete("f2.txt")
+    assert record.files.total_bytes == 4
+    assert record.files.mimetypes == ["text/plain"]
+    assert record.files.exts == ["txt"]
+
+
+def test_record_files_create_many(base_app, db, location, count_queries):
+    """Test creating many files with a constant number of queries."""
+    record = Record.create({})
+    record.files["existing.txt"] = {"metadata": {"description": "Existing"}}
+
+    files = [(f"f{i}.txt", {"metadata": {"n": i}}, None) for i in range(20)]
+    files.append(
+        (
+            "remote.txt",
+            {},
+            {"file": {"uri": "https://example.org/remote.txt", "size": 10}},
+        )
+    )
+    with count_queries() as queries:
+        created = record.files.create_many(files)
+    assert len(queries) <= 8
+
+    assert [rf.key for rf in created] == [key for key, _, _ in files]
+    assert record.files["f3.txt"].metadata == {"n": 3}
+    rf = record.files["remote.txt"]
+    assert rf.object_version.is_head
+    assert rf.file.uri == "https://example.org/remote.txt"
+    assert rf.file.storage_class == "L"
+    assert record.files.bucket.size == 10
+    assert len(record.files) == 22
+
+    # Existing and duplicate keys are rejected before any insert
+    for key in ["existing.txt", "new.txt"]:
+        with pytest.raises(InvalidKeyError):
+            record.files.create_many([("new.txt", {}, None), (key, {}, None)])
+    assert "new.txt" not in record.files
+
+
+def test_record_files_create_many_extensions(base_app, db, location):
+    """Test that creating many files runs the extensions and validation."""
+    calls = []
+
+    class CallsExt(RecordExtension):
+        def pre_create(self, record):
+            calls.append(("pre_create", record.key))
+            record["created_by_ext"] = True
+
+        def post_create(self, record):
+            calls.append(("post_create", record.key))
+
+    class ExtFileRecord(FileRecord):
+        _extensions = FileRecord._extensions + [CallsExt()]
+
+    class ExtRecord(RecordBase):
+        files = FilesField(store=False, file_cls=ExtFileRecord)
+        bucket_id = ModelField()
+        bucket = ModelField(dump=False)
+
+    record = ExtRecord.create({})
+    record.files.create_many([("a.txt", {}, None), ("b.txt", {}, None)])
+    assert calls == [
+        ("pre_create", "a.txt"),
+        ("pre_create", "b.txt"),
+        ("post_create", "a.txt"),
+        ("post_create", "b.txt"),
+    ]
+    assert ExtFileRecord.get_by_key(record.id, "a.txt")["created_by_ext"]
+
+    # Invalid file records are rejected before any insert
+    schema = "local://records/record-v1.0.0.json"
+    with pytest.raises(ValidationError):
+        record.files.create_many(
+            [
+                ("c.txt", {}, None),
+                ("d.txt", {"$schema": schema, "metadata": {"title": 1}}, None),
+            ]
+        )
+    assert ExtFileRecord.get_by_key(record.id, "c.txt") is None
+
+
+def test_record_files_delete_all(base_app, db, location, count_queries):
+    """Test deleting all files with a constant number of queries."""
+    record = Record.create({})
+    for i in range(20):
+        record.files[f"f{i}.txt"] = BytesIO(b"testfile")
+    record.files.order = ["f1.txt", "f0.txt"]
+    record.files.default_preview = "f1.txt"
+    record.commit()
+    db.session.commit()
+    record = Record.get_record(record.id)
+    assert record.files.bucket.size == 160
+
+    with count_queries() as queries:
+        deleted = record.files.delete_all()
+    assert len(queries) <= 8
+    assert len(deleted) == 20
+
+    record.commit()
+    db.session.commit()
+    assert len(record.files) == 0
+    assert record.files.order == []
+    assert record.files.default_preview is None
+    assert record.files.bucket.size == 0
+    assert (
+        models.FileRecordMetadata.query.filter_by(
+            record_id=record.id, is_deleted=True
+        ).count()
+        == 20
+    )
+    heads = ObjectVersion.query.filter_by(
+        bucket_id=record.bucket_id, is_head=True
+    ).all()
+    assert len(heads) == 20
+    assert all(ov.deleted for ov in heads)
+
+
+def test_record_files_copy_to_non_empty_bucket(base_app, db, location, count_queries):
+    """Test copying only the missing or changed files."""
+    src = Record.create({})
+    for key in ["a.txt", "b.txt", "c.txt"]:
+        src.files[key] = (BytesIO(b"testfile"), {"metadata": {"key": key}})
+    src.commit()
+    dst = Record.create({})
+    dst.files.copy(src.files)
+    dst.commit()
+    db.session.commit()
+    a_version_id = dst.files["a.txt"].object_version_id
+
+    src.files["b.txt"] = {"metadata": {"key": "b.txt", "changed": True}}
+    src.files["c.txt"] = BytesIO(b"changed")
+    src.files["d.txt"] = (BytesIO(b"new"), {"metadata": {"key": "d.txt"}})
+    src.commit()
+    db.session.commit()
+
+    src = Record.get_record(src.id)
+    dst = Record.get_record(dst.id)
+    src.files.entries
+    with count_queries() as queries:
+        dst.files.copy(src.files)
+    assert len(queries) <= 10
+    dst.commit()
+    db.session.commit()
+
+    assert list(dst.files.keys()) == ["a.txt", "b.txt", "c.txt", "d.txt"]
+    assert str(dst.files["a.txt"].object_version_id) == str(a_version_id)
+    assert dst.files["b.txt"].metadata == {"key": "b.txt", "changed": True}
+    for key in ["c.txt", "d.txt"]:
+        dst_ov = dst.files[key].object_version
+        assert dst_ov.bucket_id == dst.bucket_id
+        assert dst_ov.is_head
+        assert str(dst_ov.file_id) == str(src.files[key].object_version.file_id)
+    assert dst.files["d.txt"].metadata == {"key": "d.txt"}
+
+
+def test_record_files_sync(base_app, db, location, count_queries):
+    """Test syncing the files and their metadata in bulk."""
+    src = Record.create({})
+    for i in range(10):
+        src.files[f"f{i}.txt"] = (BytesIO(b"testfile"), {"metadata": {"n": i}})
+    src.commit()
+    dst = Record.create({})
+    dst.files.copy(src.files)
+    dst.commit()
+    db.session.commit()
+
+    for i in range(10):
+        src.files[f"f{i}.txt"] = {"metadata": {"n": i, "changed": True}}
+    src.commit()
+    db.session.commit()
+
+    src_files = Record.get_record(src.id).files
+    dst = Record.get_record(dst.id)
+    src_files.entries
+    with count_queries() as queries:
+        dst.files.sync(src_files)
+    assert len(queries) <= 6
+    assert all(rf.metadata["changed"] for rf in dst.files.values())
+
+    # Deleted and added files
+    src.files.delete("f0.txt")
+    src.files["new.txt"] = (BytesIO(b"new"), {"metadata": {"new": True}})
+    src.files.order = ["new.txt"]
+    src.commit()
+    db.session.commit()
+    dst.files.sync(src.files)
+    dst.commit()
+    db.session.commit()
+
+    assert "f0.txt" not in dst.files
+    assert dst.files["new.txt"].metadata == {"new": True}
+    assert dst.files["new.txt"].object_version.bucket_id == dst.bucket_id
+    assert dst.files.order == ["new.txt"]
+    assert len(dst.files) == 10
+
+
+def test_record_files_missing_keys(base_app, db, location, count_queries):
+    """Test that missing keys are looked up in the DB at most once."""
+    record = Record.create({})
+    record.files["f1.txt"] = BytesIO(b"testfile")
+    record.commit()
+    db.session.commit()
+
+    # Entries loaded from the DB are complete
+    record.files.entries
+    with count_queries() as queries:
+        assert "missing.txt" not in record.files
+        assert record.files.get("missing.txt") is None
+    assert len(queries) == 0
+
+    # Entries loaded from a dump are looked up in the DB once
+    record = Record.get_record(record.id)
+    record.files
+    with count_queries() as queries:
+        assert "missing.txt" not in record.files
+        assert "missing.txt" not in record.files
+    assert len(queries) == 1
+
+    record.files["missing.txt"] = {"metadata": {"n": 2}}
+    assert record.files["missing.txt"].metadata == {"n": 2}
+
+
+def test_record_files_lazy_entries(base_app, db, location, mocker):
+    """Test that the file entries of a dump are loaded when accessed."""
+    record = Record2.create({})
+    for i in range(5):
+        record.files[f"f{i}.txt"] = BytesIO(b"testfile")
+    record.commit()
+    data = record.dumps()
+
+    load = mocker.spy(PartialFileDumper, "load")
+    new_record = Record2.loads(data)
+    assert new_record.files.enabled
+    assert "f1.txt" in new_record.files
+    assert list(new_record.files) == [f"f{i}.txt" for i in range(5)]
+    assert load.call_count == 0
+
+    assert new_record.files["f1.txt"].key == "f1.txt"
+    assert new_record.files["f1.txt"].record_id == record.id
+    assert load.call_count == 1
+
+
+def test_record_files_commit_benchmark(base_app, db, location, mocker, record_property):
+    """Benchmark committing a record with 1000 files."""
+    record = Record.create({})
+    metadata = {"exif": {f"tag{i}": list(range(10)) for i in range(100)}}
+    record.files.create_many(
+        [(f"f{i}.txt", {"metadata": metadata}, None) for i in range(1000)]
+    )
+
+    start = time.perf_counter()
+    record.commit()
+    record_property("first_commit_duration", time.perf_counter() - start)
+    assert len(record["files"]["entries"]) == 1000
+
+    # The unchanged metadata is not copied again
+    deepcopy = mocker.spy(dumpers, "deepcopy")
+    start = time.perf_counter()
+    record.commit()
+    record_property("commit_duration", time.perf_counter() - start)
+    assert deepcopy.call_count == 0
+
+    # The changed metadata is copied, and the dump is not affected by later
+    # changes of the file record
+    rf = record.files["f1.txt"]
+    rf["metadata"]["exif"]["tag0"] = []
+    record.commit()
+    assert deepcopy.call_count == 1
+    assert record["files"]["entries"]["f1.txt"]["metadata"]["exif"]["tag0"] == []
+    rf["metadata"]["exif"]["tag0"].append(1)
+    assert record["files"]["entries"]["f1.txt"]["metadata"]["exif"]["tag0"] == []
+
+
+def test_record_files_dump_detached(base_app, db, location):
+    """Test that the stored dumps never share data with the file records."""
+    record = Record.create({})
+    record.files["f1.txt"] = BytesIO(b"test")
+    record.files["f1.txt"] = {"metadata": {"tags": ["a"]}}
+    record.commit()
+    db.session.commit()
+
+    # The file record is loaded from the stored dump
+    record = Record.get_record(record.id)
+    rf = record.files["f1.txt"]
+    record.commit()
+    rf["metadata"]["tags"].append("b")
+    assert record["files"]["entries"]["f1.txt"]["metadata"] == {"tags": ["a"]}
+
+    # The unchanged metadata of the previous dump is reused
+    rf["metadata"]["tags"].remove("b")
+    dump = record["files"]["entries"]["f1.txt"]["metadata"]
+    record.commit()
+    assert record["files"]["entries"]["f1.txt"]["metadata"] is dump
+    assert dump is not rf["metadata"]
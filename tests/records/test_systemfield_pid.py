@@ -11,13 +11,19 @@
 
 from datetime import datetime
 
+import pytest
+from invenio_pidstore.errors import PIDDeletedError, PIDDoesNotExistError
 from invenio_pidstore.providers.recordid_v2 import RecordIdProviderV2
+from invenio_pidstore.resolver import Resolver
+from invenio_records.systemfields import RelationsField
 from mock_module.api import Record
 from mock_module.models import RecordMetadata
 from sqlalchemy import inspect
 
 from invenio_records_resources.records.api import Record as RecordBase
-from invenio_records_resources.records.systemfields import PIDField
+from invenio_records_resources.records.cache import current_read_cache
+from invenio_records_resources.records.resolver import PIDRecordResolver
+from invenio_records_resources.records.systemfields import PIDField, PIDRelation
 from invenio_records_resources.records.systemfields.pid import PIDFieldContext
 
 
@@ -109,3 +115,140 @@ def test_session_merge(base_app, db, example_record):
     Record.pid.session_merge(record)
     assert inspect(record.pid).persistent is True
     assert inspect(record.conceptpid).persistent is False
+
+
+def test_resolver_read_cache(base_app, db, count_queries):
+    """Test resolving records through the read cache."""
+
+    class CachedRecord(RecordBase):
+        model_cls = RecordMetadata
+        pid = PIDField(provider=RecordIdProviderV2, read_cache=True)
+
+    read_cache = current_read_cache()
+    read_cache.clear()
+
+    record = CachedRecord.create({"title": "Test"})
+    db.session.commit()
+    pid_value = record.pid.pid_value
+
+    # Miss, the record is loaded from the database and cached
+    assert CachedRecord.pid.resolve(pid_value)["title"] == "Test"
+    db.session.expunge_all()
+
+    with count_queries() as queries:
+        resolved = CachedRecord.pid.resolve(pid_value)
+    # Hit, only the version of the record is checked
+    assert len(queries) == 1
+    assert resolved["title"] == "Test"
+    assert resolved.pid.pid_value == pid_value
+    assert inspect(resolved.model).persistent
+
+    # Changes committed without invalidating the cache are still detected
+    resolved["title"] = "Changed"
+    resolved.commit()
+    db.session.commit()
+    db.session.expunge_all()
+    resolved = CachedRecord.pid.resolve(pid_value)
+    assert resolved["title"] == "Changed"
+
+    # Invalidation
+    read_cache.invalidate(resolved)
+    assert read_cache.get(CachedRecord, "recid", pid_value) is None
+
+
+def test_pid_record_resolver(base_app, db, count_queries):
+    """Test resolving the PID and the record in a single query."""
+
+    class JoinedRecord(RecordBase):
+        model_cls = RecordMetadata
+        pid = PIDField(provider=RecordIdProviderV2, resolver_cls=PIDRecordResolver)
+
+    record = JoinedRecord.create({"title": "Test"})
+    db.session.commit()
+    pid_value, record_id = record.pid.pid_value, record.id
+    db.session.expunge_all()
+
+    with count_queries() as queries:
+        resolved = JoinedRecord.pid.resolve(pid_value)
+    assert len(queries) == 1
+    assert resolved.id == record_id
+    assert resolved["title"] == "Test"
+    assert resolved.pid.pid_value == pid_value
+
+    # Other cases are handled by the PIDStore resolver
+    with pytest.raises(PIDDoesNotExistError):
+        JoinedRecord.pid.resolve("unknown")
+    resolved.pid.delete()
+    with pytest.raises(PIDDeletedError):
+        JoinedRecord.pid.resolve(pid_value)
+
+
+def test_probe(base_app, db):
+    """Test fetching the revision metadata of records."""
+    record = Record.create({})
+    deleted = Record.create({})
+    db.session.commit()
+    deleted.delete()
+    db.session.commit()
+
+    probes = Record.pid.probe_many(
+        [record.pid.pid_value, deleted.pid.pid_value, "unknown"]
+    )
+    assert set(probes) == {record.pid.pid_value, deleted.pid.pid_value}
+
+    probe = probes[record.pid.pid_value]
+    assert probe.id == record.id
+    assert probe.revision_id == record.revision_id
+    assert not probe.is_deleted
+    assert probe.pid_status == record.pid.status
+    assert probes[deleted.pid.pid_value].is_deleted
+
+    assert Record.pid.probe(record.pid.pid_value) == probe
+    assert Record.pid.probe("unknown") is None
+
+
+class TypedPIDFieldContext(PIDFieldContext):
+    """Context resolving ``(pid_type, pid_value)`` tuples (as vocabularies)."""
+
+    def resolve(self, pid_value):
+        """Resolve identifier."""
+        pid_type, pid_value = pid_value
+        resolver = Resolver(
+            pid_type=pid_type,
+            object_type=self.field._object_type,
+            getter=self.record_cls.get_record,
+        )
+        pid, record = resolver.resolve(pid_value)
+        self.field._set_cache(record, pid)
+        return record
+
+
+def test_overridden_resolve(base_app, db):
+    """Test fetching many records of a context overriding resolve()."""
+
+    class TypedRecord(RecordBase):
+        model_cls = RecordMetadata
+        pid = PIDField(create=False, context_cls=TypedPIDFieldContext)
+
+    record = Record.create({})
+    deleted = Record.create({})
+    db.session.commit()
+    deleted.delete()
+    db.session.commit()
+    id_ = ("recid", record.pid.pid_value)
+    ids = [id_, ("recid", deleted.pid.pid_value), ("recid", "unknown")]
+
+    assert list(TypedRecord.pid.probe_many(ids)) == [id_]
+    assert TypedRecord.pid.probe(id_).id == record.id
+    assert TypedRecord.pid.resolve_many(ids)[id_].id == record.id
+
+    class RelationsRecord(Record):
+        relations = RelationsField(
+            language=PIDRelation("metadata.language", pid_field=TypedRecord.pid)
+        )
+
+    related = RelationsRecord({"metadata": {"language": {"id": id_}}})
+    relation = related.relations.language.field
+    assert relation.missing_ids(ids) == set(ids[1:])
+    assert relation.exists(id_)
+    related.relations.validate()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Relations system field tests."""
+
+from copy import deepcopy
+
+import pytest
+from invenio_records.systemfields import RelationsField
+from invenio_records.systemfields.relations import InvalidRelationValue
+from mock_module.api import Record, RecordWithRelations
+
+from invenio_records_resources.records.cache import (
+    current_relation_cache,
+    invalidate_relation_cache,
+)
+from invenio_records_resources.records.systemfields import (
+    PIDListRelation,
+    PIDRelation,
+    dereference_many,
+)
+
+
+def test_dereference_many(base_app, db, count_queries):
+    """Test dereferencing the relations of many records at once."""
+    languages = [Record.create({"metadata": {"title": f"Lang {i}"}}) for i in range(3)]
+    records = [
+        RecordWithRelations.create(
+            {"metadata": {"inner_record": {"id": languages[i % 3].pid.pid_value}}}
+        )
+        for i in range(10)
+    ]
+    db.session.commit()
+
+    with count_queries() as queries:
+        dereference_many(records)
+    assert len(queries) == 1
+
+    for i, record in enumerate(records):
+        language = languages[i % 3]
+        assert record["metadata"]["inner_record"] == {
+            "id": language.pid.pid_value,
+            "metadata": {"title": language["metadata"]["title"]},
+            "@v": f"{language.id}::{language.revision_id}",
+        }
+
+
+def test_dereference_many_per_relation(base_app, db, count_queries):
+    """Test relations to the same record class are resolved separately."""
+
+    class TwoRelationsRecord(Record):
+        relations = RelationsField(
+            first=PIDRelation(
+                "metadata.first", keys=["metadata.title"], pid_field=Record.pid
+            ),
+            second=PIDRelation(
+                "metadata.second", keys=["metadata.title"], pid_field=Record.pid
+            ),
+        )
+
+    first = Record.create({"metadata": {"title": "First"}})
+    second = Record.create({"metadata": {"title": "Second"}})
+    db.session.commit()
+    record = TwoRelationsRecord(
+        {
+            "metadata": {
+                "first": {"id": first.pid.pid_value},
+                "second": {"id": second.pid.pid_value},
+            }
+        }
+    )
+
+    with count_queries() as queries:
+        dereference_many([record])
+    assert len(queries) == 2
+    assert record["metadata"]["first"]["metadata"] == {"title": "First"}
+    assert record["metadata"]["second"]["metadata"] == {"title": "Second"}
+
+
+def test_relation_shared_cache(base_app, db, count_queries):
+    """Test the process-wide relation cache."""
+
+    class CachedRelationsRecord(Record):
+        relations = RelationsField(
+            languages=PIDRelation(
+                "metadata.inner_record",
+                keys=["metadata.title"],
+                pid_field=Record.pid,
+                shared_cache=True,
+            )
+        )
+
+    language = Record.create({"metadata": {"title": "English"}})
+    db.session.commit()
+    data = {"metadata": {"inner_record": {"id": language.pid.pid_value}}}
+    relation_cache = current_relation_cache()
+    relation_cache.clear()
+
+    CachedRelationsRecord(deepcopy(data)).relations.dereference()
+    assert len(relation_cache) == 1
+    assert relation_cache.misses == 1
+
+    # Another record is dereferenced without querying the database
+    record = CachedRelationsRecord(deepcopy(data))
+    with count_queries() as queries:
+        record.relations.dereference()
+    assert not queries
+    assert record["metadata"]["inner_record"]["metadata"]["title"] == "English"
+    assert relation_cache.hit_rate == 0.5
+
+    # Updates of the related record invalidate the cache
+    invalidate_relation_cache(
+        [(language.pid.pid_value, str(language.id), language.revision_id + 1)]
+    )
+    assert len(relation_cache) == 0
+
+
+def test_relation_exists_many(base_app, db, count_queries):
+    """Test validating many related IDs with a single query."""
+
+    class ListRelationsRecord(Record):
+        relations = RelationsField(
+            languages=PIDListRelation(
+                "metadata.languages", keys=["metadata.title"], pid_field=Record.pid
+            )
+        )
+
+    languages = [Record.create({"metadata": {"title": f"Lang {i}"}}) for i in range(5)]
+    deleted = Record.create({})
+    db.session.commit()
+    deleted.delete()
+    db.session.commit()
+    ids = [language.pid.pid_value for language in languages]
+
+    record = ListRelationsRecord(
+        {"metadata": {"languages": [{"id": id_} for id_ in ids]}}
+    )
+    relation = record.relations.languages
+    assert relation.missing_ids(ids + [deleted.pid.pid_value, "unknown"]) == {
+        deleted.pid.pid_value,
+        "unknown",
+    }
+    assert relation.exists(ids[0])
+    assert not relation.exists("unknown")
+
+    with count_queries() as queries:
+        record.relations.validate()
+    assert len(queries) == 1
+
+    record["metadata"]["languages"].append({"id": "unknown"})
+    with pytest.raises(InvalidRelationValue):
+        record.relations.validate()
+
+    # Setting the relation validates all the values at once
+    with count_queries() as queries:
+        record.relations.languages = ids
+    assert len(queries) == 1
+    with pytest.raises(InvalidRelationValue):
+        record.relations.languages = ids + ["unknown"]
@@ -164,6 +164,38 @@ def test_files_api_flow(client, search_clear, headers, input_data, location):
     assert len(res.json["entries"]) == 0
 
 
+def test_file_metadata_etag(client, search_clear, headers, input_data, location):
+    """Test conditional requests on the file metadata."""
+    res = client.post("/mocks", headers=headers, json=input_data)
+    id_ = res.json["id"]
+    res = client.post(f"/mocks/{id_}/files", headers=headers, json=[{"key": "a.txt"}])
+    assert res.status_code == 201
+
+    res = client.get(f"/mocks/{id_}/files/a.txt", headers=headers)
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+
+    res = client.get(
+        f"/mocks/{id_}/files/a.txt", headers={**headers, "if_none_match": etag}
+    )
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+
+    # Updating the metadata changes the etag
+    res = client.put(
+        f"/mocks/{id_}/files/a.txt",
+        headers=headers,
+        json={"metadata": {"title": "New title"}},
+    )
+    assert res.status_code == 200
+    res = client.get(
+        f"/mocks/{id_}/files/a.txt", headers={**headers, "if_none_match": etag}
+    )
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    assert res.json["metadata"] == {"title": "New title"}
+
+
 def test_empty_file(client, search_clear, headers, input_data, location):
     """Test if an empty file works properly."""
     # Initialize a draft
@@ -55,3 +55,39 @@ def test_etag_delete(app, client, input_data, headers):
     headers.update(dict(if_match=revision_id))
     res = client.delete(f"/mocks/{id_}", headers=headers)
     assert res.status_code == 204
+
+
+def test_etag_read(app, client, input_data, headers):
+    """Test conditional read requests."""
+    id_ = input_data["id"]
+    revision_id = input_data["revision_id"]
+
+    res = client.get(f"/mocks/{id_}", headers=headers)
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+    assert etag == f'"{revision_id}"'
+
+    # Matching etag
+    res = client.get(f"/mocks/{id_}", headers={**headers, "if_none_match": etag})
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+    assert not res.data
+
+    # Outdated etag
+    res = client.get(f"/mocks/{id_}", headers={**headers, "if_none_match": '"100"'})
+    assert res.status_code == 200
+    assert res.json["id"] == id_
+
+
+def test_etag_read_deleted(app, client, input_data, headers):
+    """Test conditional read requests on a deleted record."""
+    id_ = input_data["id"]
+    res = client.get(f"/mocks/{id_}", headers=headers)
+    etag = res.headers["ETag"]
+
+    res = client.delete(f"/mocks/{id_}", headers=headers)
+    assert res.status_code == 204
+
+    # A matching etag does not hide the tombstone
+    res = client.get(f"/mocks/{id_}", headers={**headers, "if_none_match": etag})
+    assert res.status_code == 410
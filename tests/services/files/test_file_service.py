@@ -162,6 +162,37 @@ def test_init_files(file_service, location, example_file_record, identity_simple
     assert second_entry["access"]["hidden"] is True
 
 
+def test_list_files_paginated(
+    file_service, location, example_file_record, identity_simple
+):
+    """Test listing a page of the files of a record."""
+    recid = example_file_record["id"]
+    keys = ["data/a.csv", "data/b.csv", "data/c.csv", "data_x.csv", "readme.txt"]
+    file_service.init_files(identity_simple, recid, [{"key": k} for k in keys])
+
+    result = file_service.list_files(
+        identity_simple, recid, params={"prefix": "data/", "size": 2}
+    ).to_dict()
+    assert result["total"] == 3
+    assert [e["key"] for e in result["entries"]] == ["data/a.csv", "data/b.csv"]
+    assert result["links"]["next"].endswith(
+        f"/records/{recid}/files?page=2&prefix=data%2F&size=2&sort=key"
+    )
+    assert "prev" not in result["links"]
+
+    result = file_service.list_files(
+        identity_simple, recid, params={"page": 2, "size": 2, "sort": "-key"}
+    ).to_dict()
+    assert result["total"] == 5
+    assert [e["key"] for e in result["entries"]] == ["data/c.csv", "data/b.csv"]
+    assert "prev" in result["links"] and "next" in result["links"]
+
+    # Without parameters, all files are listed
+    result = file_service.list_files(identity_simple, recid).to_dict()
+    assert "total" not in result
+    assert len(result["entries"]) == 5
+
+
 #
 # External files
 #
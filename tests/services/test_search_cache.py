@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Search responses cache tests."""
+
+import pytest
+from invenio_db.uow import UnitOfWork
+from invenio_search.engine import dsl
+from mock_module.api import Record
+from mock_module.config import ServiceConfig
+
+from invenio_records_resources.proxies import current_search_cache
+from invenio_records_resources.services import RecordService
+from invenio_records_resources.services.search_cache import (
+    InMemorySearchCache,
+    SharedSearchCache,
+    invalidate_search_cache,
+)
+from invenio_records_resources.services.uow import RecordBulkCommitOp
+
+
+class FakeSearch(dsl.Search):
+    """Search which counts executions instead of querying the engine."""
+
+    executions = 0
+
+    def execute(self, ignore_cache=False):
+        FakeSearch.executions += 1
+        return self._response_class(self, {"hits": {"total": {"value": 0}, "hits": []}})
+
+
+@pytest.mark.parametrize("cache_cls", [InMemorySearchCache, SharedSearchCache])
+def test_search_cache_hit_and_invalidation(appctx, cache, cache_cls):
+    search_cache = cache_cls()
+    search = FakeSearch(index="records").query("match_all")
+    FakeSearch.executions = 0
+
+    search_cache.execute(search, ttl=60)
+    res = search_cache.execute(search.params(preference="other-client"), ttl=60)
+    assert FakeSearch.executions == 1
+    assert res.hits.total["value"] == 0
+
+    # A different query is not served from the cache
+    search_cache.execute(search.query("term", id="1"), ttl=60)
+    assert FakeSearch.executions == 2
+
+    # Bumping the index generation invalidates the cached responses
+    search_cache.bump_generation("records")
+    search_cache.execute(search, ttl=60)
+    assert FakeSearch.executions == 3
+
+
+@pytest.fixture()
+def cached_service(appctx, mocker):
+    """Registered service caching its search responses."""
+
+    class CachedServiceConfig(ServiceConfig):
+        search_cache_ttl = 60
+
+    service = RecordService(CachedServiceConfig)
+    registry = appctx.extensions["invenio-records-resources"].registry
+    mocker.patch.dict(registry._services, {"cached-records": service})
+    return service
+
+
+def test_invalidate_search_cache_from_record(appctx, cached_service):
+    record = Record({})
+    generation = current_search_cache.get_generation("records")
+    invalidate_search_cache(record)
+    assert current_search_cache.get_generation("records") != generation
+
+
+def test_invalidate_search_cache_not_cached(appctx, mocker):
+    bump = mocker.spy(current_search_cache, "bump_generation")
+    invalidate_search_cache(Record({}))
+    assert not bump.called
+
+
+class FakeIndexer:
+    """Indexer which records the queued records."""
+
+    def __init__(self):
+        self.queued = []
+
+    def bulk_index(self, record_ids):
+        self.queued.extend(record_ids)
+
+
+def test_invalidate_search_cache_after_bulk_commit(base_app, db, cached_service):
+    indexer = FakeIndexer()
+    records = [Record.create({}), Record.create({})]
+    generation = current_search_cache.get_generation("records")
+
+    with UnitOfWork(db.session) as uow:
+        uow.register(RecordBulkCommitOp(records, indexer))
+        assert current_search_cache.get_generation("records") == generation
+        uow.commit()
+
+    assert indexer.queued == [r.id for r in records]
+    assert current_search_cache.get_generation("records") != generation
@@ -125,3 +125,18 @@ def test_read_many_no_filter(app, search_clear, service, identity_simple, input_
         assert record["id"] is not None
         assert record["metadata"]["title"] == "Test"
         assert record["metadata"]["type"]["type"] == "test"
+
+
+def test_exists_many(app, search_clear, service, identity_simple, input_data):
+    """Check the existence of several records at once."""
+    item = service.create(identity_simple, input_data)
+    deleted = service.create(identity_simple, input_data)
+    service.delete(identity_simple, deleted.id)
+
+    assert service.exists(identity_simple, item.id)
+    assert not service.exists(identity_simple, deleted.id)
+    assert service.exists_many(identity_simple, [item.id, deleted.id, "unknown"]) == {
+        item.id: True,
+        deleted.id: False,
+        "unknown": False,
+    }
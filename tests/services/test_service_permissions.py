@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Service permission checks tests."""
+
+from types import SimpleNamespace
+
+import pytest
+from invenio_records_permissions.generators import AnyUser, RecordOwners
+from mock_module.permissions import PermissionPolicy
+
+from invenio_records_resources.services import Service, ServiceConfig
+from invenio_records_resources.services.records import permissions
+from invenio_records_resources.services.records.permissions import (
+    cached_permission_filter,
+    current_permission_filter_cache,
+    permission_filter_cache_key,
+)
+from invenio_records_resources.services.uow import RecordCommitOp, UnitOfWork
+
+
+@pytest.fixture()
+def counting_service():
+    """Service whose permission policy counts its instantiations."""
+    calls = []
+
+    class CountingPolicy(PermissionPolicy):
+        can_read = [AnyUser()]
+
+        def __init__(self, action, **kwargs):
+            calls.append((action, kwargs))
+            super().__init__(action, **kwargs)
+
+    class CountingServiceConfig(ServiceConfig):
+        permission_policy_cls = CountingPolicy
+
+    return Service(CountingServiceConfig), calls
+
+
+def test_permission_memoized_per_request(
+    base_app, db, counting_service, identity_simple
+):
+    service, calls = counting_service
+    record = SimpleNamespace(id="1234", revision_id=1)
+
+    with base_app.test_request_context():
+        assert service.check_permission(identity_simple, "read", record=record)
+        assert service.check_permission(identity_simple, "read", record=record)
+        assert len(calls) == 1
+
+        # A new revision of the record is checked again
+        record.revision_id = 2
+        assert service.check_permission(identity_simple, "read", record=record)
+        assert len(calls) == 2
+
+        # Checks with other arguments are never memoized
+        service.check_permission(identity_simple, "read", record=record, other=1)
+        service.check_permission(identity_simple, "read", record=record, other=1)
+        assert len(calls) == 4
+
+    # The memo is gone with the request
+    with base_app.test_request_context():
+        service.check_permission(identity_simple, "read", record=record)
+        assert len(calls) == 5
+
+
+def test_permission_not_memoized_outside_request(
+    base_app, db, counting_service, identity_simple
+):
+    service, calls = counting_service
+    with base_app.app_context():
+        service.check_permission(identity_simple, "read")
+        service.check_permission(identity_simple, "read")
+    assert len(calls) == 2
+
+
+def test_permission_filter_cached(base_app, db, identity_simple):
+    permission_filter_cache = current_permission_filter_cache()
+    permission_filter_cache.clear()
+    permission = PermissionPolicy("read", identity=identity_simple)
+    assert permission_filter_cache_key(permission) is not None
+
+    first = cached_permission_filter(permission)
+    second = cached_permission_filter(
+        PermissionPolicy("read", identity=identity_simple)
+    )
+    assert first == second
+    assert first is not second
+    assert permission_filter_cache.hits == 1
+
+
+def test_permission_filter_cache_disabled(base_app, db, identity_simple, mocker):
+    ext = base_app.extensions["invenio-records-resources"]
+    mocker.patch.object(ext, "permission_filter_cache", None)
+    permission = PermissionPolicy("read", identity=identity_simple)
+    assert cached_permission_filter(permission) == cached_permission_filter(permission)
+
+
+def test_permission_filter_not_cacheable(base_app, db, identity_simple):
+    class OwnersPolicy(PermissionPolicy):
+        can_read = [RecordOwners()]
+
+    # Not declared as cacheable generator
+    permission = OwnersPolicy("read", identity=identity_simple)
+    assert permission_filter_cache_key(permission) is None
+    # Extra policy arguments
+    permission = PermissionPolicy("read", identity=identity_simple, record=None)
+    assert permission_filter_cache_key(permission) is None
+
+
+def test_permission_memo_per_record_class(
+    base_app, db, counting_service, identity_simple
+):
+    service, calls = counting_service
+
+    class Draft(SimpleNamespace):
+        pass
+
+    record = SimpleNamespace(id="1234", revision_id=1)
+    draft = Draft(id="1234", revision_id=1)
+
+    with base_app.test_request_context():
+        service.check_permission(identity_simple, "read", record=record)
+        service.check_permission(identity_simple, "read", record=draft)
+        assert len(calls) == 2
+
+
+def test_permission_memo_cleared_on_record_changes(
+    base_app, db, counting_service, identity_simple
+):
+    service, calls = counting_service
+    record = SimpleNamespace(id="1234", revision_id=1, commit=lambda: None)
+
+    with base_app.test_request_context():
+        service.check_permission(identity_simple, "read", record=record)
+        with UnitOfWork(db.session) as uow:
+            # The revision of the record is only updated once flushed
+            uow.register(RecordCommitOp(record))
+            service.check_permission(identity_simple, "read", record=record)
+        assert len(calls) == 2
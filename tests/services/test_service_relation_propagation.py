@@ -10,9 +10,11 @@
 
 import random
 from copy import deepcopy
+from types import SimpleNamespace
 
 import arrow
 import pytest
+from invenio_records.systemfields import RelationsField
 from mock_module.api import Record, RecordWithRelations
 from mock_module.config import ServiceConfig as ServiceConfigBase
 
@@ -20,7 +22,9 @@ from invenio_records_resources.proxies import (
     current_notifications_registry,
     current_service_registry,
 )
+from invenio_records_resources.records.systemfields import PIDRelation
 from invenio_records_resources.services import RecordService
+from invenio_records_resources.services.records import service as service_module
 from invenio_records_resources.services.records.components import (
     ChangeNotificationsComponent,
     RelationsComponent,
@@ -64,6 +68,22 @@ def service_wrel(appctx):
     return service
 
 
+@pytest.fixture(scope="module")
+def service_wrel_partial(appctx):
+    """Service instance patching the relations in the index."""
+
+    class ServiceConfig(ServiceConfigBase):
+        """Record cls config."""
+
+        record_cls = RecordWithRelations
+        relations = {"mock-records": ["metadata.inner_record"]}
+        relations_partial_update = True
+
+        components = ServiceConfigBase.components + [RelationsComponent]
+
+    return RecordService(ServiceConfig)
+
+
 def assert_record_from_db_and_es(
     identity, service, recid, id_, title=None, title_db=None, title_es=None
 ):
@@ -145,42 +165,219 @@ def test_on_relation_update_limit(mocker, identity_simple, service_wrel):
     """Test on relation update max limit."""
     notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
     mocked_reindex = mocker.patch.object(RecordService, "reindex")
+    # fields which are not known relations are matched on the ids only
+    mocker.patch.dict(
+        service_wrel.config.relations,
+        {"mock-records": ["metadata.inner_record", "metadata.unknown"]},
+    )
 
     def _call(n_records, limit):
         records_list = []
-        for _ in range(n_records):
+        for i in range(n_records):
             _rand = random.randint(1000, 999999)
-            records_list.append((_rand, _rand, _rand))  # recid, uuid, revision_id
+            records_list.append((i, _rand, _rand))  # recid, uuid, revision_id
         service_wrel.on_relation_update(
             identity_simple, "mock-records", records_list, notif_time, limit
         )
 
+    def _ids(call_index):
+        _, _, kwargs = mocked_reindex.mock_calls[call_index]
+        clauses = kwargs["search_query"].to_dict()["bool"]["should"]
+        # one clause per field
+        assert len(clauses) == 2
+        inner_record, unknown = clauses
+        assert "must_not" not in unknown["bool"]
+        return inner_record["bool"]["must"][0]["terms"]["metadata.inner_record.id"]
+
     _call(n_records=3, limit=5)
-    # below the limit - expected: 1 call, 3 clauses
-    mocked_reindex.call_count == 1
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 3
+    # below the limit - expected: 1 call with 3 ids
+    assert mocked_reindex.call_count == 1
+    assert len(_ids(0)) == 3
 
     mocked_reindex.reset_mock()
 
     _call(n_records=5, limit=5)
-    # on the limit - expected: 1 call, 5 clauses
-    mocked_reindex.call_count == 1
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 5
+    # on the limit - expected: 1 call with 5 ids
+    assert mocked_reindex.call_count == 1
+    assert len(_ids(0)) == 5
 
     mocked_reindex.reset_mock()
 
     _call(n_records=8, limit=5)
-    # over the limit - expected: 2 calls, 5 clauses
-    mocked_reindex.call_count == 2
-    # first call
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 5
-    # second call
-    _, _, kwargs = mocked_reindex.mock_calls[1]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 3
+    # over the limit - expected: 2 calls with 5 and 3 ids
+    assert mocked_reindex.call_count == 2
+    assert len(_ids(0)) == 5
+    assert len(_ids(1)) == 3
+
+
+def test_on_relation_update_terms(mocker, identity_simple, service_wrel):
+    """Test grouping the updated records of a relation in terms queries."""
+    notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+    mocked_reindex = mocker.patch.object(RecordService, "reindex")
+
+    records_info = [(str(i), f"uuid-{i}", 1) for i in range(250)]
+    # duplicates are merged, keeping the latest revision
+    records_info += [("0", "uuid-0", 3), ("0", "uuid-0", 2)]
+    service_wrel.on_relation_update(
+        identity_simple, "mock-records", records_info, notif_time, limit=100
+    )
+
+    # the terms are split in chunks of `limit` ids
+    assert mocked_reindex.call_count == 3
+    versions = []
+    for call in mocked_reindex.mock_calls:
+        (clause,) = call.kwargs["search_query"].to_dict()["bool"]["should"]
+        ids = clause["bool"]["must"][0]["terms"]["metadata.inner_record.id"]
+        chunk = clause["bool"]["must_not"][0]["terms"]["metadata.inner_record.@v"]
+        assert len(ids) == len(chunk) <= 100
+        versions.extend(chunk)
+    assert len(versions) == 250
+    assert "uuid-0::3" in versions
+
+
+def test_on_relation_update_single_query(mocker, identity_simple, service_wrel):
+    """Test that a notification is matched with one query by default."""
+    notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+    mocked_reindex = mocker.patch.object(RecordService, "reindex")
+
+    records_info = [(str(i), f"uuid-{i}", 1) for i in range(1000)]
+    service_wrel.on_relation_update(
+        identity_simple, "mock-records", records_info, notif_time
+    )
+    assert mocked_reindex.call_count == 1
+
+
+def test_relation_partial_update(
+    app, service, service_wrel, service_wrel_partial, identity_simple, input_data
+):
+    """Test patching the relations in the index."""
+    item = service.create(identity_simple, input_data)
+    id_ = item.id
+    wrel_data = deepcopy(input_data)
+    wrel_data["metadata"]["inner_record"] = {"id": id_}
+    rec = service_wrel.create(identity_simple, wrel_data)
+    service_wrel.record_cls.index.refresh()
+
+    updated_data = deepcopy(input_data)
+    updated_data["metadata"]["title"] = "new title"
+    item = service.update(identity_simple, id_, updated_data)
+    notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+    service_wrel_partial.on_relation_update(
+        identity_simple,
+        "mock-records",
+        [(id_, str(item._record.id), item._record.revision_id)],
+        notif_time,
+    )
+    service_wrel.record_cls.index.refresh()
+
+    # the search document is patched without going through the indexer queue
+    assert_record_from_db_and_es(
+        identity_simple, service_wrel, rec.id, id_, "new title"
+    )
+    assert service_wrel.indexer.process_bulk_queue() == (0, 0)
+
+
+def test_on_relation_update_partial(mocker, db, identity_simple, service_wrel_partial):
+    """Test that relations are patched instead of reindexing the records."""
+    mocked_reindex = mocker.patch.object(RecordService, "reindex")
+    mocked_patch = mocker.patch.object(RecordService, "patch_relations")
+
+    related = Record.create({"metadata": {"title": "Related"}})
+    db.session.commit()
+    records_info = [(related.pid.pid_value, str(related.id), related.revision_id)]
+    notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+    service_wrel_partial.on_relation_update(
+        identity_simple, "mock-records", records_info, notif_time
+    )
+    assert not mocked_reindex.called
+    _, args, _ = mocked_patch.mock_calls[0]
+    assert args[1] == {
+        "metadata.inner_record": {
+            related.pid.pid_value: {
+                "id": related.pid.pid_value,
+                "metadata": {"title": "Related"},
+                "@v": f"{related.id}::{related.revision_id}",
+            }
+        }
+    }
+
+    # relations which cannot be resolved are reindexed
+    mocked_patch.reset_mock()
+    service_wrel_partial.on_relation_update(
+        identity_simple, "mock-records", [("unknown", "uuid", 1)], notif_time
+    )
+    assert not mocked_patch.called
+    assert mocked_reindex.call_count == 1
+
+
+def test_relation_patches_batch(db, count_queries, service_wrel_partial):
+    """Test that the updated related records are resolved with one query."""
+    related = [Record.create({"metadata": {"title": f"Title {i}"}}) for i in range(3)]
+    db.session.commit()
+    records_info = [(r.pid.pid_value, str(r.id), r.revision_id) for r in related]
+
+    with count_queries() as queries:
+        patches = service_wrel_partial._relation_patches(
+            ["metadata.inner_record"], records_info
+        )
+    assert len(queries) == 1
+    assert patches["metadata.inner_record"] == {
+        r.pid.pid_value: {
+            "id": r.pid.pid_value,
+            "metadata": {"title": r["metadata"]["title"]},
+            "@v": f"{r.id}::{r.revision_id}",
+        }
+        for r in related
+    }
+
+
+def test_patch_relations_failures(mocker, identity_simple):
+    """Test matching on the value key and reindexing the failed patches."""
+
+    class ValueKeyRecord(RecordWithRelations):
+        relations = RelationsField(
+            languages=PIDRelation(
+                "metadata.inner_record",
+                keys=["metadata.title"],
+                pid_field=Record.pid,
+                _value_key_suffix="pid",
+            )
+        )
+
+    class ServiceConfig(ServiceConfigBase):
+        record_cls = ValueKeyRecord
+
+    service = RecordService(ServiceConfig)
+    hits = [
+        SimpleNamespace(
+            meta=SimpleNamespace(index="records", id=f"uuid-{i}", version=1),
+            to_dict=lambda: {"metadata": {"inner_record": {"pid": "1"}}},
+        )
+        for i in range(3)
+    ]
+    search = mocker.MagicMock()
+    search.query.return_value.params.return_value.scan.return_value = hits
+    mocker.patch.object(RecordService, "search_request", return_value=search)
+    bulk_index = mocker.patch.object(service.config.indexer_cls, "bulk_index")
+
+    actions = []
+
+    def _bulk(client, actions_iter, **kwargs):
+        actions.extend(actions_iter)
+        errors = [
+            {"index": {"_id": "uuid-0", "status": 409, "error": "conflict"}},
+            {"index": {"_id": "uuid-1", "status": 400, "error": "mapping"}},
+        ]
+        return 1, errors
+
+    mocker.patch.object(service_module.search_engine.helpers, "bulk", _bulk)
+
+    patch = {"pid": "1", "metadata": {"title": "New"}, "@v": "uuid::2"}
+    service.patch_relations(
+        identity_simple, {"metadata.inner_record": {"1": patch}}, None
+    )
+    assert [a["_source"]["metadata"]["inner_record"] for a in actions] == [patch] * 3
+    # version conflicts are already covered by a more recent indexing
+    bulk_index.assert_called_once_with(["uuid-1"])
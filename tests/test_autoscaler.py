@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Bulk indexers autoscaler tests."""
+
+from invenio_records_resources.autoscaler import BulkIndexerAutoscaler
+
+
+def test_scale_with_backlog():
+    now = [0]
+    autoscaler = BulkIndexerAutoscaler(
+        consumer_rate=10, target_drain_time=10, timer=lambda: now[0]
+    )
+
+    # Empty queue
+    decision = autoscaler.scale("records", 0, 0, max_consumers=5)
+    assert (decision.start, decision.eta) == (0, 0.0)
+
+    # 250 messages need 3 consumers to be drained in 10s
+    decision = autoscaler.scale("records", 250, 1, max_consumers=5)
+    assert (decision.start, decision.consumers) == (2, 3)
+    assert decision.chunk_size == 100
+    assert round(decision.eta) == 8
+
+    # Never more than the maximum number of consumers
+    decision = autoscaler.scale("records", 100000, 0, max_consumers=5)
+    assert (decision.start, decision.chunk_size) == (5, 2000)
+
+
+def test_measured_rate():
+    now = [0]
+    autoscaler = BulkIndexerAutoscaler(
+        consumer_rate=10, target_drain_time=10, smoothing=1, timer=lambda: now[0]
+    )
+    assert autoscaler.scale("records", 1000, 2, max_consumers=2).consumers == 2
+
+    # 2 consumers drained 800 messages in 10s
+    now[0] = 10
+    decision = autoscaler.scale("records", 200, 2, max_consumers=5)
+    assert decision.rate == 40
+    assert decision.start == 0
+
+    # A growing backlog does not change the estimate
+    now[0] = 20
+    assert autoscaler.scale("records", 300, 2, max_consumers=5).rate == 40
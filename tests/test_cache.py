@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""In-process cache tests."""
+
+from invenio_records_resources.cache import LRUCache
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_expiry():
+    now = [0]
+    cache = LRUCache(maxsize=10, ttl=10, timer=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=100)
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_counters():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    cache.delete("a")
+    assert "a" not in cache
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-Records-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Change notifications tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from invenio_records_resources.notifications import merge_records_info
+from invenio_records_resources.proxies import current_notifications_registry
+from invenio_records_resources.services.uow import (
+    ChangeNotificationOp,
+    UnitOfWork,
+)
+from invenio_records_resources.tasks import send_change_notifications
+
+
+def _record(recid, uuid, revision_id):
+    return SimpleNamespace(
+        pid=SimpleNamespace(pid_value=recid), id=uuid, revision_id=revision_id
+    )
+
+
+def test_merge_records_info():
+    records_info = [("a", "1", 2), ("b", "2", 1), ("a", "1", 3), ("a", "1", 1)]
+    assert merge_records_info(records_info) == [("a", "1", 3), ("b", "2", 1)]
+
+
+def test_notifications_merged_per_uow(mocker, db):
+    task = mocker.patch(
+        "invenio_records_resources.services.uow.send_change_notifications"
+    )
+    with UnitOfWork(db.session) as uow:
+        uow.register(ChangeNotificationOp("vocab", [_record("a", "1", 1)]))
+        uow.register(ChangeNotificationOp("other", [_record("c", "3", 1)]))
+        uow.register(ChangeNotificationOp("vocab", [_record("b", "2", 1)]))
+        uow.register(ChangeNotificationOp("vocab", [_record("a", "1", 2)]))
+        uow.commit()
+
+    assert task.delay.call_count == 2
+    task.delay.assert_any_call("vocab", [("a", "1", 2), ("b", "2", 1)])
+    task.delay.assert_any_call("other", [("c", "3", 1)])
+
+
+def test_notifications_debounced(mocker, db, base_app):
+    base_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_DEBOUNCE"] = True
+    task = mocker.patch(
+        "invenio_records_resources.services.uow.send_change_notifications"
+    )
+    publish = mocker.patch(
+        "invenio_records_resources.services.uow.publish_change_notification"
+    )
+    try:
+        with UnitOfWork(db.session) as uow:
+            uow.register(ChangeNotificationOp("vocab", [_record("a", "1", 1)]))
+            uow.register(ChangeNotificationOp("vocab", [_record("b", "2", 1)]))
+            uow.commit()
+    finally:
+        base_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_DEBOUNCE"] = False
+
+    assert not task.delay.called
+    publish.assert_called_once_with("vocab", [("a", "1", 1), ("b", "2", 1)])
+
+
+@pytest.fixture()
+def handlers(mocker, appctx, base_app):
+    """Register a failing and a recording notification handler."""
+    calls = []
+
+    def failing(identity, record_type, records_info, task_start):
+        calls.append("failed")
+        raise RuntimeError()
+
+    def recording(identity, record_type, records_info, task_start):
+        calls.append(records_info)
+
+    mocker.patch.dict(
+        current_notifications_registry._handlers, {"vocab": [failing, recording]}
+    )
+    mocker.patch.dict(
+        base_app.config, {"RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_CHUNK_SIZE": 2}
+    )
+    return calls
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_send_change_notifications_eager(handlers, mocker, base_app, workers):
+    mocker.patch.dict(
+        base_app.config,
+        {"RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_EAGER_WORKERS": workers},
+    )
+    rollback = mocker.patch("invenio_records_resources.tasks.db.session.rollback")
+    records_info = [("a", "1", 1), ("b", "2", 1), ("c", "3", 1)]
+    with pytest.raises(RuntimeError):
+        send_change_notifications("vocab", records_info)
+    # the failing handler is retried and does not affect the other one
+    attempts = base_app.config["RECORDS_RESOURCES_CHANGE_NOTIFICATIONS_MAX_RETRIES"] + 1
+    assert handlers.count("failed") == 2 * attempts
+    assert rollback.call_count == 2 * attempts
+    assert sorted(c for c in handlers if c != "failed") == [
+        [("a", "1", 1), ("b", "2", 1)],
+        [("c", "3", 1)],
+    ]
+
+
+def test_send_change_notifications_group(handlers, mocker, base_app):
+    celery_app = mocker.patch("invenio_records_resources.tasks.current_celery_app")
+    celery_app.conf.task_always_eager = False
+    group = mocker.patch("invenio_records_resources.tasks.group")
+    send_change_notifications("vocab", [("a", "1", 1), ("b", "2", 1), ("c", "3", 1)])
+
+    signatures = list(group.call_args.args[0])
+    # one task per handler and chunk
+    assert len(signatures) == 4
+    assert [s.args[1] for s in signatures] == [0, 0, 1, 1]
+    group.return_value.apply_async.assert_called_once()